@@ -5,14 +5,116 @@ Interfaces with Ollama for accessibility analysis and recommendations.
 Sends structured slide data and receives JSON responses with improvement suggestions.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import re
+import sqlite3
+import threading
 import requests
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from .contrast_checker import ContrastChecker
 
-@dataclass
+# Async HTTP client for concurrent slide analysis
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Faster JSON encoding/decoding (orjson errors subclass json.JSONDecodeError)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# The closing NDJSON line of a stream carries no text but does carry the full
+# token `context` array, so it is recognised without being decoded
+_STREAM_DONE_MARKERS = (b'"done":true', b'"response":""')
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Per-slide data block; the static instructions live in the system prompts
+_SLIDE_TEMPLATE = """- Slide #{number}
+- Title: "{title}"
+- Content: {content}
+- Images: {images}
+- Links: {links}"""
+_SINGLE_SLIDE_PROMPT_HEAD = "Analyze this slide:\n"
+_BATCH_PROMPT_HEAD = "Analyze these slides:\n\n"
+
+# Patterns used to recover JSON from free-form model responses
+_TITLE_RE = re.compile(r'"suggested_title"\s*:\s*"([^"]+)"')
+_CONFIDENCE_RE = re.compile(r'"confidence_score"\s*:\s*([0-9.]+)')
+_ARRAY_RES = {
+    "content_issues": re.compile(r'"content_issues"\s*:\s*\[([^\]]+)\]'),
+    "auto_fixable": re.compile(r'"auto_fixable"\s*:\s*\[([^\]]+)\]'),
+    "manual_review": re.compile(r'"manual_review"\s*:\s*\[([^\]]+)\]')
+}
+_QUOTED_STRING_RE = re.compile(r'"([^"]+)"')
+
+
+class _JsonObjectTracker:
+    """Incrementally tracks brace depth of streamed text to spot the end of a JSON object."""
+    
+    __slots__ = ('depth', 'started', 'in_string', 'escaped')
+    
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, text: str) -> int:
+        """
+        Consume the next chunk of model output.
+        
+        Returns:
+            Index in text just past the closing brace of the first top-level
+            object, or -1 if it has not closed yet
+        """
+        for index, char in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.started
+            elif char == '{':
+                self.depth += 1
+                self.started = True
+            elif char == '}' and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return index + 1
+        return -1
+
+
+def _extract_first_json(text: str) -> Optional[str]:
+    """Return the first balanced {...} block in text, ignoring braces inside strings."""
+    start = text.find('{')
+    if start < 0:
+        return None
+    end = _JsonObjectTracker().feed(text[start:])
+    return text[start:start + end] if end > 0 else None
+
+
+@dataclass(slots=True)
 class SlideAnalysis:
     """Structured analysis result for a single slide."""
     slide_number: int
@@ -27,7 +129,7 @@ class SlideAnalysis:
     confidence_score: float                     # AI confidence in analysis (0-1)
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessibilityResults:
     """Complete accessibility analysis results for a slide deck."""
     slides: List[SlideAnalysis]
@@ -51,7 +153,88 @@ class AIAssistant:
         "llama2",           # Fallback: Original model
     ]
     
-    def __init__(self, host: str = "localhost:11434", model: str = None, enable_fallback: bool = True):
+    # Concurrent requests for batch analysis; keep in step with OLLAMA_NUM_PARALLEL
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # Keep-alive connections kept open to the Ollama host; caps worker threads
+    HTTP_POOL_SIZE = 16
+    
+    # Maximum number of cached Ollama responses (least recently used evicted first)
+    RESPONSE_CACHE_SIZE = 1024
+    
+    # Maximum items kept per list field of an analysis response
+    STRING_LIST_LIMITS = {'content_issues': 10, 'auto_fixable': 10, 'manual_review': 10}
+    OBJECT_LIST_LIMITS = {'alt_text_suggestions': 5, 'link_improvements': 5, 'contrast_issues': 5}
+    
+    # How long Ollama keeps the model loaded after a request
+    KEEP_ALIVE = "30m"
+    
+    # Context window sizing. Ollama reloads the model whenever num_ctx changes,
+    # so requests use a fixed window and only step up for oversized prompts.
+    NUM_CTX = 4096
+    NUM_CTX_MAX = 8192
+    NUM_PREDICT_JSON = 2048
+    NUM_PREDICT_TEXT = 256  # Alt text is capped at 150 characters
+    
+    # Static instructions sent as the Ollama system prompt. Keeping them out of
+    # the per-request prompt lets Ollama reuse the cached prefix between calls.
+    ANALYSIS_SYSTEM_PROMPT = """You are a WCAG 2.1 Level AA accessibility expert for higher education, helping UNL faculty meet ADA Title II requirements (deadline April 2026). Balance technical compliance with educational effectiveness.
+
+Color contrast and missing alt text are checked separately; do not report them.
+
+Check each slide against:
+- 1.1.1 Non-text Content: images need meaningful alt text
+- 2.4.2 Page Titled: each slide needs a descriptive title
+- 2.4.4 Link Purpose: links must describe their destination
+- 1.3.1 Info and Relationships: proper heading structure
+- 3.1.5 Reading Level: academic but accessible language
+
+Examples:
+- Alt text: not "chart" but "Bar chart: Fall enrollment increased 15% from 2020 (1,200) to 2023 (1,380 students)"
+- Link: not "Click here for more information" but "View the complete 2024 Sustainability Report (PDF, 2.1MB)"
+- Title: not "Slide 5" but "Key Findings: Student Satisfaction Increased 23% After New Support Programs"
+
+Prioritize high-impact, quick fixes; consider ESL learners and varying abilities; keep scholarly rigor.
+
+Respond with a JSON object conforming to this schema:
+{
+    "suggested_title": "Specific descriptive title or null if current is adequate",
+    "alt_text_suggestions": [{"image_id": "img1", "suggested_alt": "Alt text with context and key information"}],
+    "link_improvements": [{"original_text": "vague link text", "suggested_text": "Descriptive link text"}],
+    "content_issues": ["Structural or comprehension problems with actionable solutions"],
+    "auto_fixable": ["Issues that can be resolved automatically without losing meaning"],
+    "manual_review": ["Issues requiring faculty judgment"],
+    "confidence_score": 0.95
+}"""
+    
+    BATCH_ANALYSIS_SYSTEM_PROMPT = ANALYSIS_SYSTEM_PROMPT + """
+
+You will be given several slides. Respond with {"slides": [...]} holding one object in the schema above per slide, in the same order, each with an added "slide_number" field."""
+    
+    # Multi-slide batching: slides per prompt, response tokens per slide, and a
+    # slide-data budget that keeps system + slides + response within NUM_CTX_MAX
+    BATCH_SIZE = 8
+    NUM_PREDICT_PER_BATCH_SLIDE = 512
+    BATCH_PROMPT_CHAR_BUDGET = 9000
+    
+    ALT_TEXT_SYSTEM_PROMPT = """You are a WCAG 2.1 AA accessibility expert writing alt text for university presentations.
+
+Principles:
+- Convey the information the image contributes to the learning objective
+- For charts/graphs, include key trends and specific values
+- Stay under 125 characters
+- Never start with "image of", "picture of" or "chart showing"
+- Use empty alt text ("") for purely decorative images
+
+Examples:
+- Data: "Enrollment rose 23% from 1,200 (2020) to 1,476 students (2023)"
+- Process: "Four-step research process: hypothesis → data collection → analysis → conclusions"
+- Illustration: "Diverse team collaborating around conference table, representing inclusive leadership"
+
+Respond with ONLY the alt text (no quotes, explanations, or formatting)."""
+    
+    def __init__(self, host: str = "localhost:11434", model: str = None, enable_fallback: bool = True,
+                 cache_path: Optional[str] = None, validate: bool = False):
         """
         Initialize AI assistant with Ollama connection and model selection.
         
@@ -59,34 +242,103 @@ class AIAssistant:
             host: Ollama server host:port
             model: Specific model name (if None, auto-selects best available)
             enable_fallback: Whether to fall back to other models on failure
+            cache_path: SQLite file that persists responses across runs (None = memory only)
+            validate: Check the connection and preload the model now rather than on first query
         """
-        self.host = host.rstrip('/')
+        # Accept OLLAMA_HOST-style values with a scheme; endpoint URLs are built once here
+        self.host = host.strip().split('://', 1)[-1].rstrip('/')
+        self._base_url = f"http://{self.host}"
+        self._tags_url = f"{self._base_url}/api/tags"
+        self._generate_url = f"{self._base_url}/api/generate"
         self.enable_fallback = enable_fallback
         self.logger = logging.getLogger(__name__)
         
-        # Select best available model
-        self.model = self._select_best_model(model)
+        # Pooled keep-alive session shared by all Ollama requests
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate"
+        })
+        # One host, so one pool; sized so every worker thread reuses a connection
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=self.HTTP_POOL_SIZE,
+                                                  max_retries=0))
+        
+        # Exact-match response cache keyed by model + prompt hash
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_db = self._open_cache_db(cache_path) if cache_path else None
+        
+        # Contrast is computed locally rather than asked of the model
+        self.contrast_checker = ContrastChecker()
+        
+        # Final alt text keyed by (image description, context) digest
+        self._alt_text_cache: Dict[bytes, str] = {}
+        
+        # Fetch available models once and select the best one
         self.available_models = self._get_available_models()
+        self.model = self._select_best_model(model, self.available_models)
+        self._fallback_chain = self._build_fallback_chain()
+        
+        # Validate connection now, or lazily before the first query
+        self._validated = False
+        self._validate_lock = threading.Lock()
+        if validate:
+            self._validate_connection()
+    
+    def close(self, unload_model: bool = False) -> None:
+        """
+        Close pooled HTTP connections and the persistent response cache.
+        
+        The model is preloaded in __init__ and kept resident for KEEP_ALIVE
+        so later documents skip the cold start. Pass unload_model=True to
+        free its memory immediately instead.
+        
+        Args:
+            unload_model: Ask Ollama to unload the model (keep_alive=0)
+        """
+        if unload_model:
+            try:
+                self.session.post(
+                    self._generate_url,
+                    data=_json_dumps({"model": self.model, "prompt": "", "keep_alive": 0}),
+                    headers=_JSON_HEADERS,
+                    timeout=10
+                ).raise_for_status()
+                self.logger.debug(f"Unloaded model '{self.model}'")
+            except requests.RequestException as e:
+                self.logger.warning(f"Could not unload model '{self.model}': {e}")
         
-        # Validate connection
-        self._validate_connection()
+        self.session.close()
+        if self._cache_db is not None:
+            with self._cache_lock:
+                self._cache_db.close()
+                self._cache_db = None
+    
+    def __del__(self):
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
     
     def _get_available_models(self) -> List[str]:
         """Get list of available models from Ollama server."""
         try:
-            response = requests.get(f"http://{self.host}/api/tags", timeout=10)
+            response = self.session.get(self._tags_url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             models = [model['name'] for model in data.get('models', [])]
             self.logger.debug(f"Available models: {models}")
             return models
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             self.logger.warning(f"Could not fetch available models: {e}")
             return []
     
-    def _select_best_model(self, preferred_model: str = None) -> str:
+    def _select_best_model(self, preferred_model: str = None,
+                           available_models: List[str] = None) -> str:
         """Select the best available model from hierarchy."""
-        available_models = self._get_available_models()
+        if available_models is None:
+            available_models = self._get_available_models()
         
         # If specific model requested and available, use it
         if preferred_model:
@@ -112,15 +364,53 @@ class AIAssistant:
         self.logger.error("No models available, using default 'llama2'")
         return "llama2"
     
-    def _validate_connection(self) -> None:
-        """Test connection to Ollama server."""
+    def _validate_connection(self, preload: bool = True) -> None:
+        """
+        Test connection to Ollama server and preload the selected model.
+        
+        Args:
+            preload: Load the model into memory (skipped when a query follows immediately)
+        """
+        # A non-empty model list means /api/tags already answered
+        if not self.available_models:
+            try:
+                response = self.session.get(self._tags_url, timeout=10)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                self.logger.error(f"Failed to connect to Ollama: {e}")
+                raise ConnectionError(f"Cannot connect to Ollama at {self.host}: {e}")
+        
+        self.logger.info(f"Successfully connected to Ollama at {self.host} with model '{self.model}'")
+        self._validated = True
+        
+        if preload and self.model in self.available_models:
+            self._preload_model()
+    
+    def _ensure_validated(self) -> None:
+        """Validate the connection once, on first use, if the constructor did not."""
+        if self._validated:
+            return
+        with self._validate_lock:
+            if not self._validated:
+                self._validate_connection(preload=False)
+    
+    def _preload_model(self) -> None:
+        """Load the model into memory so the first slide doesn't pay the cold start."""
+        # An empty prompt loads the model without generating. num_ctx must match
+        # later requests or Ollama reloads the model on the first real call.
+        payload = {
+            "model": self.model,
+            "prompt": "",
+            "keep_alive": self.KEEP_ALIVE,
+            "options": {"num_ctx": self.NUM_CTX}
+        }
         try:
-            response = requests.get(f"http://{self.host}/api/tags", timeout=10)
+            response = self.session.post(self._generate_url, data=_json_dumps(payload),
+                                         headers=_JSON_HEADERS, timeout=90)
             response.raise_for_status()
-            self.logger.info(f"Successfully connected to Ollama at {self.host} with model '{self.model}'")
+            self.logger.debug(f"Preloaded model '{self.model}' (keep_alive={self.KEEP_ALIVE})")
         except requests.RequestException as e:
-            self.logger.error(f"Failed to connect to Ollama: {e}")
-            raise ConnectionError(f"Cannot connect to Ollama at {self.host}: {e}")
+            self.logger.warning(f"Could not preload model '{self.model}': {e}")
     
     def analyze_slide(self, slide_data: Dict[str, Any]) -> SlideAnalysis:
         """
@@ -143,8 +433,9 @@ class AIAssistant:
         prompt = self._build_analysis_prompt(slide_data)
         
         try:
-            response = self._query_ollama(prompt)
+            response = self._query_ollama(prompt, system=self.ANALYSIS_SYSTEM_PROMPT, json_mode=True)
             analysis = self._parse_analysis_response(response, slide_data['slide_number'])
+            self._merge_deterministic_checks(analysis, slide_data)
             
             self.logger.debug(f"Analysis completed for slide {slide_data['slide_number']}")
             return analysis
@@ -152,145 +443,555 @@ class AIAssistant:
         except Exception as e:
             self.logger.error(f"Error analyzing slide {slide_data['slide_number']}: {e}")
             # Return empty analysis on failure
-            return SlideAnalysis(
-                slide_number=slide_data['slide_number'],
-                title=slide_data.get('title'),
-                suggested_title=None,
-                alt_text_suggestions=[],
-                link_improvements=[],
-                contrast_issues=[],
-                content_issues=[f"Analysis failed: {str(e)}"],
-                auto_fixable=[],
-                manual_review=["Manual review required due to analysis failure"],
-                confidence_score=0.0
+            return self._create_error_analysis(slide_data, e)
+    
+    def analyze_slides(self, slides: List[Dict[str, Any]],
+                       max_workers: int = None) -> List[SlideAnalysis]:
+        """
+        Analyze multiple slides in parallel worker threads.
+        
+        Synchronous alternative to analyze_slides_async; requests share the
+        pooled session. Ollama only serves requests in parallel up to
+        OLLAMA_NUM_PARALLEL, so keep max_workers at or below it.
+        
+        Args:
+            slides: List of slide_data dictionaries (see analyze_slide)
+            max_workers: Worker threads (default MAX_CONCURRENT_REQUESTS)
+        
+        Returns:
+            List of SlideAnalysis objects in the same order as the input slides
+        """
+        if len(slides) <= 1:
+            return [self.analyze_slide(slide_data) for slide_data in slides]
+        
+        with ThreadPoolExecutor(max_workers=self.worker_count(max_workers)) as executor:
+            return list(executor.map(self.analyze_slide, slides))
+    
+    def analyze_slides_sync(self, slides: List[Dict[str, Any]],
+                            max_concurrency: int = None) -> List[SlideAnalysis]:
+        """
+        Run analyze_slides_async from synchronous code.
+        
+        asyncio.run cannot be used inside a running event loop (e.g. a web
+        request handler), so in that case the worker-thread path is used.
+        
+        Args:
+            slides: List of slide_data dictionaries (see analyze_slide)
+            max_concurrency: Maximum in-flight requests (default MAX_CONCURRENT_REQUESTS)
+        
+        Returns:
+            List of SlideAnalysis objects in the same order as the input slides
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.analyze_slides_async(slides, max_concurrency))
+        
+        return self.analyze_slides(slides, max_concurrency)
+    
+    def worker_count(self, max_workers: Optional[int] = None) -> int:
+        """Worker threads for parallel analysis (default MAX_CONCURRENT_REQUESTS), bounded by the connection pool."""
+        return min(max_workers or self.MAX_CONCURRENT_REQUESTS, self.HTTP_POOL_SIZE)
+    
+    async def analyze_slides_async(self, slides: List[Dict[str, Any]],
+                                   max_concurrency: int = None) -> List[SlideAnalysis]:
+        """
+        Analyze multiple slides concurrently.
+        
+        All prompts are sent over one pooled aiohttp session so network I/O and
+        model compute overlap across slides. Ollama only serves requests in
+        parallel up to OLLAMA_NUM_PARALLEL; extra requests queue on the server.
+        
+        Args:
+            slides: List of slide_data dictionaries (see analyze_slide)
+            max_concurrency: Maximum in-flight requests (default MAX_CONCURRENT_REQUESTS)
+        
+        Returns:
+            List of SlideAnalysis objects in the same order as the input slides
+        """
+        if aiohttp is None:
+            self.logger.warning("aiohttp not available, analyzing slides in worker threads")
+            return self.analyze_slides(slides, max_concurrency)
+        
+        # One check up front rather than per request; it uses the blocking
+        # requests session, so it runs in a thread to keep the event loop free
+        await asyncio.to_thread(self._ensure_validated)
+        
+        limit = max_concurrency or self.MAX_CONCURRENT_REQUESTS
+        semaphore = asyncio.Semaphore(limit)
+        connector = aiohttp.TCPConnector(limit=limit, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(total=90)  # Per request, matches _query_ollama
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(*[
+                self._analyze_slide_async(session, semaphore, slide_data)
+                for slide_data in slides
+            ])
+    
+    async def _analyze_slide_async(self, session: "aiohttp.ClientSession",
+                                   semaphore: asyncio.Semaphore,
+                                   slide_data: Dict[str, Any]) -> SlideAnalysis:
+        """Async counterpart of analyze_slide used by analyze_slides_async."""
+        self.logger.debug(f"Analyzing slide {slide_data.get('slide_number', 'unknown')}")
+        
+        prompt = self._build_analysis_prompt(slide_data)
+        
+        try:
+            async with semaphore:
+                response = await self._query_ollama_async(
+                    session, prompt, system=self.ANALYSIS_SYSTEM_PROMPT, json_mode=True
+                )
+            analysis = self._parse_analysis_response(response, slide_data['slide_number'])
+            self._merge_deterministic_checks(analysis, slide_data)
+            
+            self.logger.debug(f"Analysis completed for slide {slide_data['slide_number']}")
+            return analysis
+            
+        except Exception as e:
+            self.logger.error(f"Error analyzing slide {slide_data['slide_number']}: {e}")
+            return self._create_error_analysis(slide_data, e)
+    
+    def _deterministic_checks(self, slide_data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Run the checks that don't need the model.
+        
+        Returns:
+            Tuple of (contrast_issues, auto_fixable) for the slide
+        """
+        contrast_issues = []
+        colors = slide_data.get('colors') or []
+        if colors:
+            results = self.contrast_checker.check_multiple_contrasts(colors)
+            contrast_issues = self.contrast_checker.get_accessibility_issues(results)
+        
+        auto_fixable = [
+            f"Add alt text to image {image.get('id', 'unknown')}"
+            for image in slide_data.get('images') or []
+            if not (image.get('alt_text') or '').strip()
+        ]
+        
+        return contrast_issues, auto_fixable
+    
+    def _merge_deterministic_checks(self, analysis: SlideAnalysis, slide_data: Dict[str, Any]) -> SlideAnalysis:
+        """Replace model-estimated contrast with computed ratios and add missing alt text."""
+        contrast_issues, auto_fixable = self._deterministic_checks(slide_data)
+        
+        analysis.contrast_issues = contrast_issues
+        analysis.auto_fixable = auto_fixable + [
+            item for item in analysis.auto_fixable if item not in auto_fixable
+        ]
+        return analysis
+    
+    def _create_error_analysis(self, slide_data: Dict[str, Any], error: Exception) -> SlideAnalysis:
+        """Create empty analysis for a slide whose AI analysis failed."""
+        analysis = SlideAnalysis(
+            slide_number=slide_data['slide_number'],
+            title=slide_data.get('title'),
+            suggested_title=None,
+            alt_text_suggestions=[],
+            link_improvements=[],
+            contrast_issues=[],
+            content_issues=[f"Analysis failed: {str(error)}"],
+            auto_fixable=[],
+            manual_review=["Manual review required due to analysis failure"],
+            confidence_score=0.0
+        )
+        return self._merge_deterministic_checks(analysis, slide_data)
+    
+    def analyze_slides_batch(self, slides: List[Dict[str, Any]], batch_size: int = None,
+                             max_workers: int = None) -> List[SlideAnalysis]:
+        """
+        Analyze slides several at a time with one multi-slide prompt per batch.
+        
+        Sharing one request across slides amortizes the system prompt prefill
+        and the HTTP round-trip. Batches are sent concurrently like
+        analyze_slides. Slides missing from a batch response are re-analyzed
+        individually.
+        
+        Args:
+            slides: List of slide_data dictionaries (see analyze_slide)
+            batch_size: Maximum slides per prompt (default BATCH_SIZE)
+            max_workers: Batches in flight at once (default MAX_CONCURRENT_REQUESTS)
+        
+        Returns:
+            List of SlideAnalysis objects in the same order as the input slides
+        """
+        batches = self._chunk_slides(slides, batch_size or self.BATCH_SIZE)
+        
+        if len(batches) <= 1:
+            batch_results = [self._analyze_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=self.worker_count(max_workers)) as executor:
+                batch_results = list(executor.map(self._analyze_batch, batches))
+        
+        return [analysis for results in batch_results for analysis in results]
+    
+    def _chunk_slides(self, slides: List[Dict[str, Any]],
+                      batch_size: int) -> List[List[Dict[str, Any]]]:
+        """Split slides into batches bounded by count and prompt size."""
+        batches = []
+        current = []
+        current_chars = 0
+        
+        for slide_data in slides:
+            block_chars = len(self._format_slide_block(slide_data))
+            if current and (len(current) >= batch_size or
+                            current_chars + block_chars > self.BATCH_PROMPT_CHAR_BUDGET):
+                batches.append(current)
+                current = []
+                current_chars = 0
+            current.append(slide_data)
+            current_chars += block_chars
+        
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _analyze_batch(self, batch: List[Dict[str, Any]]) -> List[SlideAnalysis]:
+        """Analyze one batch of slides with a single Ollama request."""
+        if len(batch) == 1:
+            return [self.analyze_slide(batch[0])]
+        
+        self.logger.debug(f"Analyzing slides {[s.get('slide_number') for s in batch]} in one batch")
+        
+        prompt = _BATCH_PROMPT_HEAD + "\n---\n".join(
+            self._format_slide_block(slide_data) for slide_data in batch
+        )
+        
+        try:
+            response = self._query_ollama(
+                prompt,
+                system=self.BATCH_ANALYSIS_SYSTEM_PROMPT,
+                json_mode=True,
+                num_predict=self.NUM_PREDICT_PER_BATCH_SLIDE * len(batch)
             )
+            parsed_data = self._extract_json_with_fallbacks(response)
+        except Exception as e:
+            self.logger.warning(f"Batch analysis failed, analyzing slides individually: {e}")
+            parsed_data = None
+        
+        if isinstance(parsed_data, dict):
+            entries = parsed_data.get('slides', parsed_data.get('analyses'))
+        else:
+            entries = parsed_data
+        if not isinstance(entries, list):
+            entries = []
+        entries = [entry for entry in entries if isinstance(entry, dict)]
+        
+        # Match entries by slide number, falling back to position
+        by_number = {entry.get('slide_number'): entry for entry in entries}
+        positional = len(entries) == len(batch)
+        
+        analyses = []
+        for index, slide_data in enumerate(batch):
+            entry = by_number.get(slide_data['slide_number'])
+            if entry is None and positional:
+                entry = entries[index]
+            
+            if entry is None:
+                analyses.append(self.analyze_slide(slide_data))
+            else:
+                analysis = self._build_slide_analysis(entry, slide_data['slide_number'])
+                self._merge_deterministic_checks(analysis, slide_data)
+                analyses.append(analysis)
+        
+        return analyses
+    
+    def _format_slide_block(self, slide_data: Dict[str, Any]) -> str:
+        """Format the variable slide data sent to the model as compact JSON."""
+        # Only the fields the model needs; drops shape references and other extras
+        images = [
+            {key: image.get(key) for key in ('id', 'alt_text', 'description')}
+            for image in slide_data.get('images') or []
+        ]
+        links = [
+            {key: link.get(key) for key in ('text', 'url')}
+            for link in slide_data.get('links') or []
+        ]
+        return _SLIDE_TEMPLATE.format(
+            number=slide_data['slide_number'],
+            title=slide_data.get('title') or 'No title',
+            content=_json_dumps(slide_data.get('text_content') or []).decode('utf-8'),
+            images=_json_dumps(images).decode('utf-8'),
+            links=_json_dumps(links).decode('utf-8')
+        )
     
     def _build_analysis_prompt(self, slide_data: Dict[str, Any]) -> str:
-        """Build the enhanced WCAG-expert prompt for Ollama analysis."""
-        prompt = f"""
-You are a certified WCAG 2.1 Level AA accessibility expert with 10+ years experience in higher education digital accessibility compliance. You specialize in UNL's accessibility requirements and ADA Title II compliance for universities.
-
-## EXPERT CONTEXT:
-- University faculty must meet WCAG 2.1 AA by April 2026 (ADA Title II rule)
-- You've remediated 1000+ academic presentations
-- You understand both technical compliance AND educational effectiveness
-- You know common faculty accessibility mistakes and practical solutions
-
-## ANALYSIS METHODOLOGY:
-Use systematic POUR framework analysis:
-1. **PERCEIVABLE**: Check alt text, color contrast, text alternatives
-2. **OPERABLE**: Verify keyboard navigation, focus management, timing
-3. **UNDERSTANDABLE**: Assess readability, consistent navigation, error prevention
-4. **ROBUST**: Ensure compatibility with assistive technologies
-
-## SLIDE TO ANALYZE:
-- Slide #{slide_data['slide_number']}
-- Title: "{slide_data.get('title', 'No title')}"
-- Content: {slide_data.get('text_content', [])}
-- Images: {slide_data.get('images', [])}
-- Links: {slide_data.get('links', [])}
-- Color Data: {slide_data.get('colors', [])}
-
-## EXPERT ANALYSIS EXAMPLES:
-
-**Example 1 - Image Analysis:**
-If image shows "Bar chart showing enrollment trends":
-- Bad alt: "chart" or "image of chart"
-- Expert alt: "Bar chart: Fall enrollment increased 15% from 2020 (1,200) to 2023 (1,380 students)"
-- Reasoning: Describes both content AND key data insights for academic context
-
-**Example 2 - Link Analysis:**
-- Bad: "Click here for more information"
-- Expert: "View the complete 2024 Sustainability Report (PDF, 2.1MB)"
-- Reasoning: Describes destination, format, and file size for informed decisions
-
-**Example 3 - Title Analysis:**
-- Bad: "Slide 5" or "Overview"
-- Expert: "Key Findings: Student Satisfaction Increased 23% After New Support Programs"
-- Reasoning: Descriptive, specific, conveys main message clearly
-
-## CRITICAL WCAG 2.1 AA CRITERIA TO CHECK:
-- 1.1.1 Non-text Content: All images need meaningful alt text
-- 1.4.3 Contrast Minimum: 4.5:1 normal text, 3:1 large text (18pt+/14pt+ bold)
-- 2.4.2 Page Titled: Each slide needs descriptive title
-- 2.4.4 Link Purpose: Links must describe destination
-- 1.3.1 Info and Relationships: Proper heading structure
-- 3.1.5 Reading Level: Consider academic but accessible language
-
-## UNIVERSITY-SPECIFIC CONSIDERATIONS:
-- Faculty time constraints: Prioritize high-impact, quick fixes
-- Student diversity: Consider ESL learners, varying abilities
-- Academic content: Maintain scholarly rigor while improving accessibility
-- Compliance deadline: Focus on Title II requirements
-
-Think step-by-step through each WCAG criterion, then provide your expert analysis in this EXACT JSON format:
-
-{{
-    "suggested_title": "Specific descriptive title or null if current is adequate",
-    "alt_text_suggestions": [
-        {{"image_id": "img1", "suggested_alt": "Comprehensive alt text with context and key information"}}
-    ],
-    "link_improvements": [
-        {{"original_text": "vague link text", "suggested_text": "Descriptive link with destination and format info"}}
-    ],
-    "contrast_issues": [
-        {{"element": "specific element type", "current_ratio": 2.1, "meets_aa": false, "recommendation": "Specific color improvement suggestion"}}
-    ],
-    "content_issues": ["Specific structural or comprehension problems with actionable solutions"],
-    "auto_fixable": ["Issues that can be automatically resolved without losing meaning"],
-    "manual_review": ["Issues requiring faculty judgment to maintain academic integrity"],
-    "confidence_score": 0.95
-}}
-
-Provide ONLY the JSON response, no additional text."""
-        return prompt
+        """Build the per-slide prompt; static instructions live in ANALYSIS_SYSTEM_PROMPT."""
+        return _SINGLE_SLIDE_PROMPT_HEAD + self._format_slide_block(slide_data)
     
-    def _query_ollama(self, prompt: str, max_retries: int = 3) -> str:
-        """Send prompt to Ollama and get response with fallback models."""
-        models_to_try = [self.model]
+    def _build_fallback_chain(self) -> List[str]:
+        """Order the selected model first, followed by available fallback models."""
+        chain = [self.model]
         
         # Add fallback models if enabled
         if self.enable_fallback:
             for model in self.MODEL_HIERARCHY:
                 if model != self.model and model in self.available_models:
-                    models_to_try.append(model)
+                    chain.append(model)
         
-        last_error = None
+        return chain
+    
+    def _open_cache_db(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """
+        Open (or create) the persistent response cache.
+        
+        Args:
+            cache_path: Path to the SQLite cache file
+            
+        Returns:
+            Connection shared by all worker threads, or None if it cannot be opened
+        """
+        try:
+            db = sqlite3.connect(cache_path, check_same_thread=False)
+            db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+            db.commit()
+            self.logger.debug(f"Using persistent response cache at {cache_path}")
+            return db
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not open response cache '{cache_path}': {e}")
+            return None
+    
+    def _get_cache_key(self, prompt: str, system: Optional[str] = None,
+                       json_mode: bool = False) -> str:
+        """Hash the model, request options and prompt into a response cache key."""
+        key_source = f"{self.model}\n{json_mode}\n{system or ''}\n{prompt}"
+        return hashlib.blake2b(key_source.encode('utf-8'), digest_size=20).hexdigest()
+    
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Return a cached Ollama response, marking it most recently used."""
+        with self._cache_lock:
+            response_text = self._response_cache.get(key)
+            if response_text is not None:
+                self._response_cache.move_to_end(key)
+            elif self._cache_db is not None:
+                try:
+                    row = self._cache_db.execute(
+                        "SELECT response FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Response cache read failed: {e}")
+                    row = None
+                if row is not None:
+                    response_text = row[0]
+                    self._remember_response(key, response_text)
+            
+            if response_text is not None:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+            return response_text
+    
+    def _cache_response(self, key: str, response_text: str) -> None:
+        """Store an Ollama response in memory and, if enabled, on disk."""
+        with self._cache_lock:
+            self._remember_response(key, response_text)
+            if self._cache_db is not None:
+                try:
+                    self._cache_db.execute(
+                        "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                        (key, response_text)
+                    )
+                    self._cache_db.commit()
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Response cache write failed: {e}")
+    
+    def _remember_response(self, key: str, response_text: str) -> None:
+        """Add a response to the in-memory LRU, evicting the oldest entry if full (lock held)."""
+        self._response_cache[key] = response_text
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Report response cache effectiveness.
         
-        for attempt, model in enumerate(models_to_try[:max_retries]):
-            payload = {
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.3,  # Lower temperature for more consistent JSON
-                    "top_p": 0.9,
-                    "num_predict": 2048  # Limit response length
-                }
+        Returns:
+            Dictionary with hit/miss counts, hit rate and entry counts
+        """
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            stats = {
+                'hits': self._cache_hits,
+                'misses': self._cache_misses,
+                'hit_rate': self._cache_hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._response_cache),
+                'persistent': self._cache_db is not None,
             }
+            if self._cache_db is not None:
+                try:
+                    stats['disk_entries'] = self._cache_db.execute(
+                        "SELECT COUNT(*) FROM responses"
+                    ).fetchone()[0]
+                except sqlite3.Error:
+                    stats['disk_entries'] = None
+            return stats
+    
+    def _get_num_ctx(self, prompt: str, system: Optional[str], num_predict: int) -> int:
+        """Choose a context window large enough for the prompt and response."""
+        # Rough estimate of ~3 characters per token
+        needed = (len(prompt) + len(system or '')) // 3 + num_predict
+        if needed <= self.NUM_CTX:
+            return self.NUM_CTX
+        return self.NUM_CTX_MAX
+    
+    def _build_generate_payload(self, model: str, prompt: str, system: Optional[str] = None,
+                                json_mode: bool = False,
+                                num_predict: Optional[int] = None) -> Dict[str, Any]:
+        """Build the /api/generate request body for a model and prompt."""
+        if num_predict is None:
+            num_predict = self.NUM_PREDICT_JSON if json_mode else self.NUM_PREDICT_TEXT
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,  # NDJSON chunks, read as they are generated
+            "keep_alive": self.KEEP_ALIVE,
+            "options": {
+                "temperature": 0.3,  # Lower temperature for more consistent JSON
+                "top_p": 0.9,
+                "num_predict": num_predict,  # Limit response length
+                "num_ctx": self._get_num_ctx(prompt, system, num_predict),
+                "num_batch": 512  # Prompt tokens processed per prefill step
+            }
+        }
+        if system:
+            payload["system"] = system
+        if json_mode:
+            payload["format"] = "json"  # Constrain decoding to valid JSON
+        return payload
+    
+    def _query_ollama(self, prompt: str, max_retries: int = 3,
+                      system: Optional[str] = None, json_mode: bool = False,
+                      num_predict: Optional[int] = None) -> str:
+        """Send prompt to Ollama and get response with fallback models."""
+        cache_key = self._get_cache_key(prompt, system, json_mode)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            self.logger.debug("Using cached Ollama response")
+            return cached
+        
+        self._ensure_validated()
+        
+        last_error = None
+        
+        for attempt, model in enumerate(self._fallback_chain[:max_retries]):
+            payload = self._build_generate_payload(model, prompt, system, json_mode, num_predict)
             
             try:
                 self.logger.debug(f"Attempt {attempt + 1}: Trying model '{model}'")
-                response = requests.post(
-                    f"http://{self.host}/api/generate",
-                    json=payload,
-                    timeout=90  # Increased timeout for larger models
-                )
-                response.raise_for_status()
+                with self.session.post(
+                    self._generate_url,
+                    data=_json_dumps(payload),
+                    headers=_JSON_HEADERS,
+                    timeout=90,  # Increased timeout for larger models
+                    stream=True
+                ) as response:
+                    response.raise_for_status()
+                    
+                    parts = []
+                    tracker = _JsonObjectTracker() if json_mode else None
+                    for line in response.iter_lines():
+                        if self._append_stream_chunk(line, parts, tracker):
+                            break
                 
-                result = response.json()
-                response_text = result.get('response', '')
+                response_text = ''.join(parts)
                 
                 if response_text.strip():  # Valid response
                     if model != self.model:
                         self.logger.info(f"Successfully used fallback model: {model}")
+                    self._cache_response(cache_key, response_text)
                     return response_text
                 else:
                     self.logger.warning(f"Empty response from model '{model}'")
                     last_error = "Empty response"
                     continue
                 
-            except requests.RequestException as e:
+            except (requests.RequestException, ValueError) as e:  # ValueError: malformed body
+                self.logger.warning(f"Model '{model}' failed: {e}")
+                last_error = e
+                continue
+        
+        # All models failed
+        self.logger.error(f"All models failed. Last error: {last_error}")
+        raise ConnectionError(f"Failed to get response from any model. Last error: {last_error}")
+    
+    def _append_stream_chunk(self, line: bytes, parts: List[str],
+                             tracker: Optional[_JsonObjectTracker] = None) -> bool:
+        """
+        Collect the text from one streamed NDJSON line.
+        
+        In JSON mode the model tends to pad a finished object with whitespace
+        until num_predict runs out, so a tracker lets the caller stop reading
+        (and close the connection, which aborts generation) as soon as the
+        object is complete.
+        
+        Args:
+            line: Raw NDJSON line from the response body
+            parts: Accumulated response text
+            tracker: Optional brace tracker for JSON-mode requests
+            
+        Returns:
+            True once Ollama reports the generation is done or the JSON object is complete
+        """
+        line = line.strip()
+        if not line:
+            return False
+        
+        if all(marker in line for marker in _STREAM_DONE_MARKERS):
+            return True
+        
+        chunk = _json_loads(line)
+        if chunk.get('error'):
+            raise ValueError(f"Ollama error: {chunk['error']}")
+        
+        text = chunk.get('response', '')
+        parts.append(text)
+        if chunk.get('done'):
+            return True
+        return tracker is not None and tracker.feed(text) >= 0
+    
+    async def _query_ollama_async(self, session: "aiohttp.ClientSession", prompt: str,
+                                  max_retries: int = 3, system: Optional[str] = None,
+                                  json_mode: bool = False) -> str:
+        """Async counterpart of _query_ollama using a shared aiohttp session."""
+        cache_key = self._get_cache_key(prompt, system, json_mode)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            self.logger.debug("Using cached Ollama response")
+            return cached
+        
+        last_error = None
+        
+        for attempt, model in enumerate(self._fallback_chain[:max_retries]):
+            payload = self._build_generate_payload(model, prompt, system, json_mode)
+            
+            try:
+                self.logger.debug(f"Attempt {attempt + 1}: Trying model '{model}'")
+                async with session.post(self._generate_url,
+                                        data=_json_dumps(payload),
+                                        headers=_JSON_HEADERS) as response:
+                    response.raise_for_status()
+                    
+                    parts = []
+                    tracker = _JsonObjectTracker() if json_mode else None
+                    async for line in response.content:
+                        if self._append_stream_chunk(line, parts, tracker):
+                            break
+                
+                response_text = ''.join(parts)
+                
+                if response_text.strip():  # Valid response
+                    if model != self.model:
+                        self.logger.info(f"Successfully used fallback model: {model}")
+                    self._cache_response(cache_key, response_text)
+                    return response_text
+                else:
+                    self.logger.warning(f"Empty response from model '{model}'")
+                    last_error = "Empty response"
+                    continue
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
                 self.logger.warning(f"Model '{model}' failed: {e}")
                 last_error = e
                 continue
@@ -308,72 +1009,42 @@ Provide ONLY the JSON response, no additional text."""
             # All parsing failed - create analysis from text patterns
             return self._create_fallback_analysis(response, slide_number)
         
-        # Validate and sanitize the parsed data
-        validated_data = self._validate_and_sanitize_json(parsed_data)
-        
+        return self._build_slide_analysis(parsed_data, slide_number)
+    
+    def _build_slide_analysis(self, parsed_data: Dict[str, Any], slide_number: int) -> SlideAnalysis:
+        """Create SlideAnalysis from parsed model output."""
+        # The sanitized dict carries exactly the model-derived fields, so it maps straight onto the dataclass
         return SlideAnalysis(
             slide_number=slide_number,
             title=None,  # Will be set by processor
-            suggested_title=validated_data.get('suggested_title'),
-            alt_text_suggestions=validated_data.get('alt_text_suggestions', []),
-            link_improvements=validated_data.get('link_improvements', []),
-            contrast_issues=validated_data.get('contrast_issues', []),
-            content_issues=validated_data.get('content_issues', []),
-            auto_fixable=validated_data.get('auto_fixable', []),
-            manual_review=validated_data.get('manual_review', []),
-            confidence_score=validated_data.get('confidence_score', 0.5)
+            **self._validate_and_sanitize_json(parsed_data)
         )
     
     def _extract_json_with_fallbacks(self, response: str) -> Optional[Dict[str, Any]]:
-        """Try multiple strategies to extract JSON from AI response."""
+        """
+        Extract JSON from AI response.
+        
+        Analysis requests use Ollama's JSON mode, so the response normally
+        parses directly. The fallbacks cover models that ignore JSON mode and
+        output truncated at num_predict.
+        """
         response = response.strip()
         
         # Strategy 1: Response is pure JSON
         try:
-            return json.loads(response)
+            return _json_loads(response)
         except json.JSONDecodeError:
             pass
         
-        # Strategy 2: Find JSON block between braces
+        # Strategy 2: First balanced JSON object, skipping any surrounding prose
         try:
-            start = response.find('{')
-            end = response.rfind('}') + 1
-            if start >= 0 and end > start:
-                json_block = response[start:end]
-                return json.loads(json_block)
+            json_block = _extract_first_json(response)
+            if json_block is not None:
+                return _json_loads(json_block)
         except json.JSONDecodeError:
             pass
         
-        # Strategy 3: Find JSON in code blocks (```json)
-        try:
-            import re
-            json_pattern = r'```(?:json)?\s*({.*?})\s*```'
-            match = re.search(json_pattern, response, re.DOTALL | re.IGNORECASE)
-            if match:
-                return json.loads(match.group(1))
-        except (json.JSONDecodeError, AttributeError):
-            pass
-        
-        # Strategy 4: Clean common formatting issues
-        try:
-            # Remove markdown formatting
-            cleaned = re.sub(r'`{1,3}(?:json)?', '', response, flags=re.IGNORECASE)
-            
-            # Fix common JSON issues
-            cleaned = cleaned.replace('\n', ' ')  # Remove newlines
-            cleaned = re.sub(r'\s+', ' ', cleaned)  # Normalize whitespace
-            cleaned = cleaned.replace("'", '"')  # Fix quotes
-            
-            # Try to extract JSON again
-            start = cleaned.find('{')
-            end = cleaned.rfind('}') + 1
-            if start >= 0 and end > start:
-                json_block = cleaned[start:end]
-                return json.loads(json_block)
-        except (json.JSONDecodeError, AttributeError):
-            pass
-        
-        # Strategy 5: Partial JSON reconstruction
+        # Strategy 3: Partial JSON reconstruction
         try:
             return self._reconstruct_partial_json(response)
         except Exception:
@@ -384,8 +1055,6 @@ Provide ONLY the JSON response, no additional text."""
     
     def _reconstruct_partial_json(self, response: str) -> Optional[Dict[str, Any]]:
         """Attempt to reconstruct JSON from partial or malformed response."""
-        import re
-        
         # Initialize result structure
         result = {
             "suggested_title": None,
@@ -399,14 +1068,12 @@ Provide ONLY the JSON response, no additional text."""
         }
         
         # Extract suggested title
-        title_pattern = r'"suggested_title"\s*:\s*"([^"]+)"'
-        title_match = re.search(title_pattern, response)
+        title_match = _TITLE_RE.search(response)
         if title_match:
             result["suggested_title"] = title_match.group(1)
         
         # Extract confidence score
-        confidence_pattern = r'"confidence_score"\s*:\s*([0-9.]+)'
-        confidence_match = re.search(confidence_pattern, response)
+        confidence_match = _CONFIDENCE_RE.search(response)
         if confidence_match:
             try:
                 result["confidence_score"] = float(confidence_match.group(1))
@@ -414,18 +1081,12 @@ Provide ONLY the JSON response, no additional text."""
                 pass
         
         # Extract arrays (simplified)
-        array_patterns = {
-            "content_issues": r'"content_issues"\s*:\s*\[([^\]]+)\]',
-            "auto_fixable": r'"auto_fixable"\s*:\s*\[([^\]]+)\]',
-            "manual_review": r'"manual_review"\s*:\s*\[([^\]]+)\]'
-        }
-        
-        for key, pattern in array_patterns.items():
-            match = re.search(pattern, response)
+        for key, pattern in _ARRAY_RES.items():
+            match = pattern.search(response)
             if match:
                 # Simple string extraction (not perfect but functional)
                 items_text = match.group(1)
-                items = re.findall(r'"([^"]+)"', items_text)
+                items = _QUOTED_STRING_RE.findall(items_text)
                 result[key] = items
         
         # Only return if we found some useful data
@@ -437,9 +1098,17 @@ Provide ONLY the JSON response, no additional text."""
         return result if has_data else None
     
     def _validate_and_sanitize_json(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate and sanitize parsed JSON data."""
+        """
+        Validate and sanitize parsed JSON data.
+        
+        Only the known SlideAnalysis fields are read; anything else the model
+        emitted is never touched.
+        """
         validated = {}
         
+        if not isinstance(data, dict):
+            data = {}
+        
         # Validate suggested_title
         title = data.get('suggested_title')
         if title and isinstance(title, str) and title.strip() and title.lower() != 'null':
@@ -447,26 +1116,20 @@ Provide ONLY the JSON response, no additional text."""
         else:
             validated['suggested_title'] = None
         
-        # Validate arrays
-        array_fields = [
-            'alt_text_suggestions', 'link_improvements', 'contrast_issues',
-            'content_issues', 'auto_fixable', 'manual_review'
-        ]
+        # Validate arrays against the prebuilt field limits
+        for field, limit in self.STRING_LIST_LIMITS.items():
+            value = data.get(field)
+            if isinstance(value, list):
+                # Strip each item once and stop after the limit
+                stripped = (str(item).strip() for item in value if item)
+                validated[field] = list(islice(filter(None, stripped), limit))
+            else:
+                validated[field] = []
         
-        for field in array_fields:
-            value = data.get(field, [])
+        for field, limit in self.OBJECT_LIST_LIMITS.items():
+            value = data.get(field)
             if isinstance(value, list):
-                # Sanitize list items
-                if field in ['content_issues', 'auto_fixable', 'manual_review']:
-                    # Simple string arrays
-                    validated[field] = [str(item).strip() for item in value 
-                                      if item and str(item).strip()][:10]  # Limit count
-                elif field in ['alt_text_suggestions', 'link_improvements', 'contrast_issues']:
-                    # Object arrays
-                    validated[field] = [item for item in value 
-                                      if isinstance(item, dict)][:5]  # Limit count
-                else:
-                    validated[field] = value
+                validated[field] = list(islice((item for item in value if isinstance(item, dict)), limit))
             else:
                 validated[field] = []
         
@@ -531,51 +1194,30 @@ Provide ONLY the JSON response, no additional text."""
         Returns:
             Suggested alt text
         """
-        prompt = f"""
-You are a WCAG 2.1 AA accessibility expert specializing in academic content. Generate optimal alt text for university presentations.
-
-## IMAGE ANALYSIS:
-Visual Description: {image_description}
-Slide Context: {context}
-
-## EXPERT ALT TEXT PRINCIPLES:
-1. **Academic Context**: Provide meaningful information for learning objectives
-2. **Data Priority**: For charts/graphs, include key trends and specific values
-3. **Concise but Complete**: Under 125 characters while conveying essential information
-4. **No Redundancy**: Avoid "image of", "picture of", "chart showing"
-5. **Functional Purpose**: Focus on why the image supports the content
-
-## EXAMPLES BY IMAGE TYPE:
-
-**Data Visualization:**
-- Poor: "Bar chart about enrollment"
-- Expert: "Enrollment rose 23% from 1,200 (2020) to 1,476 students (2023)"
-
-**Process Diagram:**
-- Poor: "Flowchart showing steps"
-- Expert: "Four-step research process: hypothesis → data collection → analysis → conclusions"
-
-**Decorative Images:**
-- Poor: "University logo"
-- Expert: "" (empty alt for decorative)
-
-**Conceptual Illustration:**
-- Poor: "Picture of teamwork"
-- Expert: "Diverse team collaborating around conference table, representing inclusive leadership"
-
-## ANALYSIS CHECKLIST:
-□ Does alt text serve the image's educational purpose?
-□ Would a student understand the key information without seeing the image?
-□ Is it specific enough to differentiate from similar images?
-□ Does it support the slide's learning objective?
-
-Provide ONLY the optimized alt text (no quotes, explanations, or formatting):
-"""
+        # Repeated images (logos, banners) reuse the first result
+        key_hash = hashlib.blake2b(digest_size=16)
+        key_hash.update(image_description.encode('utf-8'))
+        key_hash.update(b'\0')
+        key_hash.update(context.encode('utf-8'))
+        cache_key = key_hash.digest()
+        
+        with self._cache_lock:
+            cached = self._alt_text_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        prompt = f"""Visual Description: {image_description}
+Slide Context: {context}"""
         
         try:
-            response = self._query_ollama(prompt)
-            alt_text = response.strip().strip('"\'')
-            return alt_text[:150]  # Limit length
+            response = self._query_ollama(prompt, system=self.ALT_TEXT_SYSTEM_PROMPT)
+            alt_text = response.strip().strip('"\'')[:150]  # Limit length
+            
+            with self._cache_lock:  # Shared by alt text worker threads
+                if len(self._alt_text_cache) >= self.RESPONSE_CACHE_SIZE:
+                    self._alt_text_cache.pop(next(iter(self._alt_text_cache)), None)
+                self._alt_text_cache[cache_key] = alt_text
+            return alt_text
             
         except Exception as e:
             self.logger.error(f"Failed to generate alt text: {e}")
@@ -12,14 +12,113 @@ Key principles from UNL's LISTS framework:
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
 from .ai_assistant import AIAssistant
 
+# Common problematic alt text patterns to flag
+POOR_ALT_TEXT_PATTERNS = (
+    "image", "picture", "photo", "graphic", "screenshot",
+    "click here", "see image", "view image", "image of",
+    "picture of", "photo of", "graphic of"
+)
 
-@dataclass
+# All poor patterns in one expression, so clean alt text is cleared in a single scan
+_POOR_ALT_TEXT_RE = re.compile('|'.join(map(re.escape, POOR_ALT_TEXT_PATTERNS)))
+
+# Maximum recommended alt text length (per WCAG guidelines)
+MAX_ALT_TEXT_LENGTH = 125
+
+# Redundant lead-ins ("Image of ...", "Alt text: ...") stripped from generated alt text
+_REDUNDANT_PREFIX_RE = re.compile(
+    r'^\s*["\']?\s*(?:image|picture|photo|graphic|screenshot)\s+of\s+|^\s*["\']?\s*(?:image|alt text)\s*:\s*',
+    re.IGNORECASE
+)
+
+# Fixed instructions for improving alt text. Sent as the system prompt so the
+# identical prefix is reused by Ollama across images instead of re-prefilled.
+_IMPROVEMENT_SYSTEM_PROMPT = f"""Improve alt text for better accessibility.
+
+Create improved alt text that:
+- Is concise and descriptive
+- Avoids redundant phrases like "image of"
+- Focuses on relevant information for the context
+- Is under {MAX_ALT_TEXT_LENGTH} characters
+
+Respond with ONLY the improved alt text, no quotes or extra text."""
+
+# Description keywords used to triage images, checked in this priority order
+_DECORATIVE_PATTERNS = (
+    'border', 'divider', 'decoration', 'ornament',
+    'background', 'texture', 'pattern'
+)
+_FUNCTIONAL_PATTERNS = (
+    'button', 'icon', 'link', 'navigation', 'menu',
+    'close', 'open', 'download', 'search'
+)
+_COMPLEX_PATTERNS = (
+    'chart', 'graph', 'diagram', 'flowchart',
+    'table', 'data', 'statistics', 'timeline'
+)
+
+
+def _keyword_re(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Match any keyword at the start of a word (so plurals match but "reborder" does not)."""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, patterns)) + ')')
+
+
+_DECORATIVE_RE = _keyword_re(_DECORATIVE_PATTERNS)
+_FUNCTIONAL_RE = _keyword_re(_FUNCTIONAL_PATTERNS)
+_COMPLEX_RE = _keyword_re(_COMPLEX_PATTERNS)
+
+# Image types whose alt text has to come from the model
+_AI_IMAGE_TYPES = frozenset(("informative", "complex", "functional"))
+
+_NON_DESCRIPTIVE_ALT_TEXT = frozenset(['image', 'photo', 'picture', 'graphic', 'screenshot'])
+
+
+@lru_cache(maxsize=4096)
+def _identify_alt_text_issues_cached(alt_text: str) -> Tuple[str, ...]:
+    """Identify issues with alt text; cached because the same text is scored repeatedly."""
+    issues = []
+    
+    if not alt_text.strip():
+        issues.append("Missing alt text")
+        return tuple(issues)
+    
+    alt_lower = alt_text.lower().strip()
+    
+    # Check for problematic patterns (per-pattern report only when one is present)
+    if _POOR_ALT_TEXT_RE.search(alt_lower):
+        for pattern in POOR_ALT_TEXT_PATTERNS:
+            if pattern in alt_lower:
+                issues.append(f"Contains generic term: '{pattern}'")
+    
+    # Check length
+    if len(alt_text) > MAX_ALT_TEXT_LENGTH:
+        issues.append(f"Too long ({len(alt_text)} chars, max {MAX_ALT_TEXT_LENGTH})")
+    
+    # Check for redundant phrases
+    if alt_text.lower().startswith(('image of', 'picture of', 'photo of')):
+        issues.append("Starts with redundant phrase")
+    
+    # Check if it's too generic
+    if len(alt_text.strip()) < 5:
+        issues.append("Too short/generic")
+    
+    # Check for non-descriptive text
+    if alt_lower in _NON_DESCRIPTIVE_ALT_TEXT:
+        issues.append("Non-descriptive alt text")
+    
+    return tuple(issues)
+
+
+@dataclass(slots=True, frozen=True)
 class AltTextSuggestion:
     """Suggestion for alt text improvement."""
     image_id: str
@@ -32,7 +131,7 @@ class AltTextSuggestion:
     is_empty_appropriate: bool  # True if image is decorative and should have empty alt
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageAnalysis:
     """Analysis result for a single image."""
     image_id: str
@@ -52,15 +151,8 @@ class AltTextGenerator:
     Implements UNL's accessibility standards for digital course materials.
     """
     
-    # Common problematic alt text patterns to flag
-    POOR_ALT_TEXT_PATTERNS = [
-        "image", "picture", "photo", "graphic", "screenshot",
-        "click here", "see image", "view image", "image of",
-        "picture of", "photo of", "graphic of"
-    ]
-    
-    # Maximum recommended alt text length (per WCAG guidelines)
-    MAX_ALT_TEXT_LENGTH = 125
+    POOR_ALT_TEXT_PATTERNS = POOR_ALT_TEXT_PATTERNS
+    MAX_ALT_TEXT_LENGTH = MAX_ALT_TEXT_LENGTH
     
     def __init__(self, ai_assistant: AIAssistant):
         """
@@ -73,38 +165,53 @@ class AltTextGenerator:
         self.logger = logging.getLogger(__name__)
     
     def analyze_images(self, images: List[Dict[str, Any]], 
-                      slide_context: str = "") -> List[ImageAnalysis]:
+                      slide_context: str = "",
+                      max_workers: Optional[int] = None) -> List[ImageAnalysis]:
         """
         Analyze multiple images for alt text quality.
         
+        Each image needs its own model call, so images are analyzed in worker
+        threads sharing the assistant's pooled session.
+        
         Args:
             images: List of image dictionaries with metadata
             slide_context: Context from the slide containing the images
+            max_workers: Worker threads (default AIAssistant.MAX_CONCURRENT_REQUESTS)
             
         Returns:
-            List of ImageAnalysis objects
+            List of ImageAnalysis objects in the same order as the input images
         """
-        analyses = []
+        # Triage the whole slide at once so the shared context is scanned only
+        # once; this runs outside the per-image error handling below, so a
+        # missing description or context is read as empty rather than raising
+        image_types = self._classify_image_types(
+            [image.get('description') or '' for image in images], slide_context or ''
+        )
         
-        for image in images:
+        def analyze(image: Dict[str, Any], image_type: str) -> ImageAnalysis:
             try:
-                analysis = self.analyze_single_image(image, slide_context)
-                analyses.append(analysis)
+                return self.analyze_single_image(image, slide_context, image_type)
             except Exception as e:
                 self.logger.error(f"Failed to analyze image {image.get('id', 'unknown')}: {e}")
                 # Create error analysis
-                analyses.append(self._create_error_analysis(image))
+                return self._create_error_analysis(image)
+        
+        if len(images) <= 1:
+            return [analyze(image, image_type) for image, image_type in zip(images, image_types)]
         
-        return analyses
+        with ThreadPoolExecutor(max_workers=self.ai_assistant.worker_count(max_workers)) as executor:
+            return list(executor.map(analyze, images, image_types))
     
     def analyze_single_image(self, image: Dict[str, Any], 
-                           slide_context: str = "") -> ImageAnalysis:
+                           slide_context: str = "",
+                           image_type: Optional[str] = None) -> ImageAnalysis:
         """
         Analyze a single image for alt text quality.
         
         Args:
             image: Image dictionary with metadata
             slide_context: Context from the slide
+            image_type: Precomputed image type (classified here if None)
             
         Returns:
             ImageAnalysis object
@@ -121,7 +228,7 @@ class AltTextGenerator:
         
         # Generate suggestions using AI
         suggestions = self._generate_alt_text_suggestions(
-            image, slide_context, current_alt
+            image, slide_context, current_alt, image_type
         )
         
         # Determine priority based on issues found
@@ -192,7 +299,7 @@ class AltTextGenerator:
         try:
             # Generate improved alt text
             prompt = self._build_improvement_prompt(current_alt, image_description, context, issues)
-            improved_alt = self.ai_assistant._query_ollama(prompt)
+            improved_alt = self.ai_assistant._query_ollama(prompt, system=_IMPROVEMENT_SYSTEM_PROMPT)
             
             # Clean and validate the improved text
             cleaned_alt = self._clean_alt_text(improved_alt)
@@ -209,79 +316,51 @@ class AltTextGenerator:
     
     def _identify_alt_text_issues(self, alt_text: str) -> List[str]:
         """Identify issues with current alt text."""
-        issues = []
-        
-        if not alt_text.strip():
-            issues.append("Missing alt text")
-            return issues
-        
-        alt_lower = alt_text.lower().strip()
-        
-        # Check for problematic patterns
-        for pattern in self.POOR_ALT_TEXT_PATTERNS:
-            if pattern in alt_lower:
-                issues.append(f"Contains generic term: '{pattern}'")
-        
-        # Check length
-        if len(alt_text) > self.MAX_ALT_TEXT_LENGTH:
-            issues.append(f"Too long ({len(alt_text)} chars, max {self.MAX_ALT_TEXT_LENGTH})")
-        
-        # Check for redundant phrases
-        if alt_text.lower().startswith(('image of', 'picture of', 'photo of')):
-            issues.append("Starts with redundant phrase")
-        
-        # Check if it's too generic
-        if len(alt_text.strip()) < 5:
-            issues.append("Too short/generic")
-        
-        # Check for non-descriptive text
-        non_descriptive = ['image', 'photo', 'picture', 'graphic', 'screenshot']
-        if alt_lower.strip() in non_descriptive:
-            issues.append("Non-descriptive alt text")
-        
-        return issues
+        return list(_identify_alt_text_issues_cached(alt_text))
     
     def _generate_alt_text_suggestions(self, image: Dict[str, Any],
-                                     context: str, current_alt: str) -> List[AltTextSuggestion]:
+                                     context: str, current_alt: str,
+                                     image_type: Optional[str] = None) -> List[AltTextSuggestion]:
         """Generate AI-powered alt text suggestions."""
+        image_id = image.get('id', 'unknown')
+        description = image.get('description', '')
+        
+        # Determine image type based on context and description
+        if image_type is None:
+            image_type = self._classify_image_type(description, context)
+        
+        # Decorative images only ever need empty alt text, so no model call is made
+        if image_type not in _AI_IMAGE_TYPES:
+            if not current_alt.strip():
+                return []
+            return [AltTextSuggestion(
+                image_id=image_id,
+                current_alt_text=current_alt,
+                suggested_alt_text="",
+                confidence=0.9,
+                reasoning="Image appears decorative and should have empty alt text",
+                image_type=image_type,
+                context=context,
+                is_empty_appropriate=True
+            )]
+        
         suggestions = []
         
         try:
-            image_id = image.get('id', 'unknown')
-            description = image.get('description', '')
+            # Generate descriptive alt text for informative images
+            suggested_alt = self.generate_alt_text(description, context, image_type)
             
-            # Determine image type based on context and description
-            image_type = self._classify_image_type(description, context)
-            
-            # Generate suggestion based on image type
-            if image_type == "decorative":
-                # Decorative images should have empty alt text
-                if current_alt.strip():
-                    suggestions.append(AltTextSuggestion(
-                        image_id=image_id,
-                        current_alt_text=current_alt,
-                        suggested_alt_text="",
-                        confidence=0.9,
-                        reasoning="Image appears decorative and should have empty alt text",
-                        image_type=image_type,
-                        context=context,
-                        is_empty_appropriate=True
-                    ))
-            else:
-                # Generate descriptive alt text for informative images
-                suggested_alt = self.generate_alt_text(description, context, image_type)
-                
-                if suggested_alt and suggested_alt != current_alt:
-                    suggestions.append(AltTextSuggestion(
-                        image_id=image_id,
-                        current_alt_text=current_alt,
-                        suggested_alt_text=suggested_alt,
-                        confidence=0.8,
-                        reasoning=f"Generated descriptive alt text for {image_type} image",
-                        image_type=image_type,
-                        context=context,
-                        is_empty_appropriate=False
-                    ))
+            if suggested_alt and suggested_alt != current_alt:
+                suggestions.append(AltTextSuggestion(
+                    image_id=image_id,
+                    current_alt_text=current_alt,
+                    suggested_alt_text=suggested_alt,
+                    confidence=0.8,
+                    reasoning=f"Generated descriptive alt text for {image_type} image",
+                    image_type=image_type,
+                    context=context,
+                    is_empty_appropriate=False
+                ))
         
         except Exception as e:
             self.logger.warning(f"Failed to generate suggestions: {e}")
@@ -295,66 +374,48 @@ class AltTextGenerator:
         Returns:
             Image type: "informative", "decorative", "complex", or "functional"
         """
-        desc_lower = description.lower()
-        context_lower = context.lower()
-        
-        # Patterns suggesting decorative images
-        decorative_patterns = [
-            'border', 'divider', 'decoration', 'ornament',
-            'background', 'texture', 'pattern'
-        ]
-        
-        # Patterns suggesting functional images
-        functional_patterns = [
-            'button', 'icon', 'link', 'navigation', 'menu',
-            'close', 'open', 'download', 'search'
-        ]
-        
-        # Patterns suggesting complex images
-        complex_patterns = [
-            'chart', 'graph', 'diagram', 'flowchart',
-            'table', 'data', 'statistics', 'timeline'
-        ]
-        
-        # Check for patterns
-        for pattern in decorative_patterns:
-            if pattern in desc_lower:
-                return "decorative"
-        
-        for pattern in functional_patterns:
-            if pattern in desc_lower:
-                return "functional"
-        
-        for pattern in complex_patterns:
-            if pattern in desc_lower or pattern in context_lower:
-                return "complex"
-        
-        # Default to informative
-        return "informative"
+        return self._classify_image_types([description], context)[0]
+    
+    def _classify_image_types(self, descriptions: List[str], context: str) -> List[str]:
+        """
+        Classify several images that share the same surrounding context.
+        
+        Args:
+            descriptions: Image descriptions
+            context: Slide context shared by all images
+            
+        Returns:
+            Image type for each description, in order
+        """
+        # A complex-content context applies to every image on the slide
+        context_is_complex = _COMPLEX_RE.search(context.lower()) is not None
+        
+        image_types = []
+        for description in descriptions:
+            desc_lower = description.lower()
+            
+            if _DECORATIVE_RE.search(desc_lower):
+                image_types.append("decorative")
+            elif _FUNCTIONAL_RE.search(desc_lower):
+                image_types.append("functional")
+            elif context_is_complex or _COMPLEX_RE.search(desc_lower):
+                image_types.append("complex")
+            else:
+                # Default to informative
+                image_types.append("informative")
+        
+        return image_types
     
     def _clean_alt_text(self, alt_text: str) -> str:
         """Clean and standardize generated alt text."""
         if not alt_text:
             return ""
         
-        cleaned = alt_text.strip()
-        
-        # Remove redundant phrases
-        redundant_prefixes = [
-            'image of ', 'picture of ', 'photo of ', 'graphic of ',
-            'screenshot of ', 'image: ', 'alt text: '
-        ]
-        
-        for prefix in redundant_prefixes:
-            if cleaned.lower().startswith(prefix):
-                cleaned = cleaned[len(prefix):]
-        
-        # Remove quotes if present
-        cleaned = cleaned.strip('\'"')
+        # Drop a redundant lead-in, then surrounding whitespace and quotes
+        cleaned = _REDUNDANT_PREFIX_RE.sub('', alt_text, count=1).strip(' \t\r\n\'"')
         
         # Ensure proper capitalization
-        if cleaned and not cleaned[0].isupper():
-            cleaned = cleaned[0].upper() + cleaned[1:]
+        cleaned = cleaned[:1].upper() + cleaned[1:]
         
         # Truncate if too long
         if len(cleaned) > self.MAX_ALT_TEXT_LENGTH:
@@ -373,24 +434,11 @@ class AltTextGenerator:
     
     def _build_improvement_prompt(self, current_alt: str, description: str,
                                 context: str, issues: List[str]) -> str:
-        """Build prompt for improving existing alt text."""
-        prompt = f"""
-Improve this alt text for better accessibility:
-
-Current alt text: "{current_alt}"
+        """Build the per-image part of the improvement prompt."""
+        return f"""Current alt text: "{current_alt}"
 Image description: {description}
 Context: {context}
-Issues found: {', '.join(issues)}
-
-Create improved alt text that:
-- Is concise and descriptive
-- Avoids redundant phrases like "image of"
-- Focuses on relevant information for the context
-- Is under {self.MAX_ALT_TEXT_LENGTH} characters
-
-Respond with ONLY the improved alt text, no quotes or extra text:
-"""
-        return prompt
+Issues found: {', '.join(issues)}"""
     
     def _is_better_alt_text(self, current: str, improved: str) -> bool:
         """Check if improved alt text is actually better than current."""
@@ -12,12 +12,191 @@ WCAG 2.1 Level AA Requirements:
 
 import logging
 import re
+from functools import lru_cache
+from math import pow as _pow
 from typing import Dict, List, Tuple, Optional, Any
 from colorzero import Color
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+def _srgb_to_linear(value: float) -> float:
+    """Linearize one sRGB channel value in [0, 1] (IEC 61966-2-1 breakpoint, as in WCAG 2.1)."""
+    if value <= 0.04045:
+        return value / 12.92
+    return _pow((value + 0.055) / 1.055, 2.4)
+
+
+# Colors come from 8-bit hex/rgb values, so every channel is one of 256 levels
+_SRGB_LUT = tuple(_srgb_to_linear(i / 255) for i in range(256))
+_SRGB_LUT_ARRAY = np.array(_SRGB_LUT) if np is not None else None
+
+
+# rgb(r, g, b) with optional whitespace around each component
+_RGB_RE = re.compile(r'rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)')
+
+# Colors are handled internally as packed 0xRRGGBB ints
+_BLACK = 0x000000
+_WHITE = 0xFFFFFF
+
+# Common names resolved without going through colorzero
+_NAMED_COLORS: Dict[str, int] = {
+    'black': _BLACK,
+    'white': _WHITE,
+    'red': 0xFF0000,
+    'green': 0x008000,
+    'blue': 0x0000FF,
+    'yellow': 0xFFFF00,
+    'orange': 0xFFA500,
+    'purple': 0x800080,
+    'gray': 0x808080,
+    'grey': 0x808080,
+    'silver': 0xC0C0C0,
+    'navy': 0x000080,
+    'maroon': 0x800000,
+}
+
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+
+def _pack_rgb(r: int, g: int, b: int) -> int:
+    """Pack 8-bit channels into 0xRRGGBB."""
+    return (r << 16) | (g << 8) | b
+
+
+def _unpack_rgb(packed: int) -> Tuple[int, int, int]:
+    """Split 0xRRGGBB into 8-bit (r, g, b) channels."""
+    return packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF
+
+
+def _packed_luminance(packed: int) -> float:
+    """Relative luminance of a packed 0xRRGGBB color via the sRGB table."""
+    # Most slides put text on white or black, whose luminance is known exactly
+    if packed == _WHITE:
+        return 1.0
+    if packed == _BLACK:
+        return 0.0
+    return (0.2126 * _SRGB_LUT[packed >> 16] +
+            0.7152 * _SRGB_LUT[(packed >> 8) & 0xFF] +
+            0.0722 * _SRGB_LUT[packed & 0xFF])
+
+
+def _contrast_from_luminance(lum1: float, lum2: float) -> float:
+    """WCAG contrast ratio for two relative luminances (unrounded; WCAG thresholds are exact)."""
+    # Ensure lighter color is in numerator
+    lighter = max(lum1, lum2)
+    darker = min(lum1, lum2)
+    
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+@lru_cache(maxsize=65536)
+def _packed_contrast_ratio(low_key: int, high_key: int) -> float:
+    """Contrast ratio for a normalized (low, high) pair of packed colors."""
+    return _contrast_from_luminance(_packed_luminance(low_key), _packed_luminance(high_key))
+
+
+def _batch_contrast_ratios(fg_keys: "np.ndarray", bg_keys: "np.ndarray") -> "np.ndarray":
+    """Unrounded contrast ratios for arrays of packed fg/bg colors, vectorized through the sRGB table."""
+    packed = np.stack((fg_keys, bg_keys))
+    r = _SRGB_LUT_ARRAY[packed >> 16]
+    g = _SRGB_LUT_ARRAY[(packed >> 8) & 0xFF]
+    b = _SRGB_LUT_ARRAY[packed & 0xFF]
+    # Same operation order as _packed_luminance so ratios match exactly
+    luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
+    return (luminance.max(axis=0) + 0.05) / (luminance.min(axis=0) + 0.05)
+
+
+def _hex_to_u24(color_str: str) -> Optional[int]:
+    """Decode lowercase '#rgb' or '#rrggbb' to packed 0xRRGGBB; None if malformed."""
+    digits = color_str[1:]
+    if not _HEX_DIGITS.issuperset(digits):
+        return None
+    if len(digits) == 6:
+        return int(digits, 16)
+    if len(digits) == 3:
+        return int(digits[0] * 2 + digits[1] * 2 + digits[2] * 2, 16)
+    return None
+
+
+def _parse_color(color_str: str) -> Optional[int]:
+    """Parse color string into a packed 0xRRGGBB int."""
+    if not isinstance(color_str, str):
+        logger.error(f"Color parsing error: expected a string, got {color_str!r}")
+        return None
+    
+    # Normalize so "#FFF" and " #fff" share a cache entry
+    color_str = color_str.strip().lower()
+    packed = _parse_normalized_color(color_str)
+    if packed is not None:
+        return packed
+    
+    # Failures are logged here rather than in the cached parser, so each one is reported
+    if color_str.startswith('#'):
+        logger.error(f"Color parsing error: {color_str} is not a valid hex color")
+        return None
+    
+    # Default to black if parsing fails
+    logger.warning(f"Could not parse color: {color_str}")
+    return _BLACK
+
+
+@lru_cache(maxsize=4096)
+def _parse_normalized_color(color_str: str) -> Optional[int]:
+    """Parse a stripped, lowercased color string; cached since palettes repeat. None if unparseable."""
+    # Handle hex colors
+    if color_str.startswith('#'):
+        return _hex_to_u24(color_str)
+    
+    # Handle rgb() format
+    if color_str.startswith('rgb'):
+        rgb_match = _RGB_RE.match(color_str)
+        if rgb_match:
+            r, g, b = map(int, rgb_match.groups())
+            if max(r, g, b) <= 255:
+                return _pack_rgb(r, g, b)
+    
+    # Handle named colors, common ones without colorzero
+    packed = _NAMED_COLORS.get(color_str)
+    if packed is not None:
+        return packed
+    try:
+        return _pack_rgb(*Color(color_str).rgb_bytes)
+    except ValueError:
+        return None
+
+
+def _format_hex(packed: int) -> str:
+    """Format a packed color as '#rrggbb'."""
+    return f"#{packed:06x}"
+
+
+# Fixed high contrast pairings offered whenever normal text fails AA
+_HIGH_CONTRAST_TEMPLATES = (
+    {
+        "type": "high_contrast",
+        "description": "Use black text on white background",
+        "original_color": None,  # Filled in per result
+        "suggested_color": "#000000",
+        "background_color": "#ffffff"
+    },
+    {
+        "type": "high_contrast",
+        "description": "Use white text on dark background",
+        "original_color": None,  # Filled in per result
+        "suggested_color": "#ffffff",
+        "background_color": "#1a1a1a"
+    },
+)
+
+
+@dataclass(slots=True)
 class ContrastResult:
     """Result of a contrast ratio check."""
     foreground_color: str
@@ -31,6 +210,7 @@ class ContrastResult:
     text_content: Optional[str] = None
     font_size: Optional[float] = None
     is_bold: bool = False
+    is_large_text: bool = False  # WCAG "large" (18pt+, or 14pt+ bold)
 
 
 class ContrastChecker:
@@ -49,6 +229,13 @@ class ContrastChecker:
     # Large text thresholds (in points)
     LARGE_TEXT_SIZE = 18.0
     LARGE_TEXT_BOLD_SIZE = 14.0
+    _LARGE_TEXT_THRESHOLDS = (LARGE_TEXT_SIZE, LARGE_TEXT_BOLD_SIZE)  # Indexed by is_bold
+    
+    # Bisection steps when solving for a compliant brightness (1/4096 precision)
+    BRIGHTNESS_SEARCH_STEPS = 12
+    
+    # Below this many colors the per-item loop beats NumPy's setup cost
+    VECTORIZE_MIN_ITEMS = 32
     
     def __init__(self):
         """Initialize contrast checker."""
@@ -79,10 +266,10 @@ class ContrastChecker:
         """
         try:
             # Parse colors
-            fg_color = self._parse_color(foreground)
-            bg_color = self._parse_color(background)
+            fg_color = _parse_color(foreground)
+            bg_color = _parse_color(background)
             
-            if not fg_color or not bg_color:
+            if fg_color is None or bg_color is None:
                 self.logger.warning(f"Could not parse colors: {foreground}, {background}")
                 return self._create_error_result(foreground, background, element_type)
             
@@ -101,7 +288,7 @@ class ContrastChecker:
             result = ContrastResult(
                 foreground_color=foreground,
                 background_color=background,
-                contrast_ratio=ratio,
+                contrast_ratio=round(ratio, 2),  # Rounded for reporting only
                 meets_aa_normal=meets_aa_normal,
                 meets_aa_large=meets_aa_large,
                 meets_aaa_normal=meets_aaa_normal,
@@ -109,7 +296,8 @@ class ContrastChecker:
                 element_type=element_type,
                 text_content=text_content,
                 font_size=font_size,
-                is_bold=is_bold
+                is_bold=is_bold,
+                is_large_text=is_large_text
             )
             
             # Log results for debugging
@@ -132,18 +320,69 @@ class ContrastChecker:
         Returns:
             List of ContrastResult objects
         """
-        results = []
+        if np is None or len(color_data) < self.VECTORIZE_MIN_ITEMS:
+            return [self._check_color_data(data) for data in color_data]
         
-        for data in color_data:
-            result = self.check_contrast(
-                foreground=data.get('foreground', '#000000'),
-                background=data.get('background', '#ffffff'),
-                element_type=data.get('element_type', 'text'),
-                text_content=data.get('text_content'),
-                font_size=data.get('font_size'),
-                is_bold=data.get('is_bold', False)
-            )
-            results.append(result)
+        return self._check_multiple_contrasts_vectorized(color_data)
+    
+    def _check_color_data(self, data: Dict[str, Any]) -> ContrastResult:
+        """Check one color_data entry (see check_multiple_contrasts)."""
+        return self.check_contrast(
+            foreground=data.get('foreground', '#000000'),
+            background=data.get('background', '#ffffff'),
+            element_type=data.get('element_type', 'text'),
+            text_content=data.get('text_content'),
+            font_size=data.get('font_size'),
+            is_bold=data.get('is_bold', False)
+        )
+    
+    def _check_multiple_contrasts_vectorized(self, color_data: List[Dict[str, Any]]) -> List[ContrastResult]:
+        """
+        Compute all contrast ratios in one NumPy pass.
+        
+        Colors are packed to 0xRRGGBB and linearized through the sRGB table as
+        arrays; only the final ContrastResult objects are built per item.
+        Entries whose colors do not parse go through check_contrast so they
+        are reported the same way.
+        """
+        results: List[Optional[ContrastResult]] = [None] * len(color_data)
+        indices, fg_keys, bg_keys = [], [], []
+        
+        for index, data in enumerate(color_data):
+            fg_color = _parse_color(data.get('foreground', '#000000'))
+            bg_color = _parse_color(data.get('background', '#ffffff'))
+            
+            if fg_color is None or bg_color is None:
+                results[index] = self._check_color_data(data)
+            else:
+                indices.append(index)
+                fg_keys.append(fg_color)
+                bg_keys.append(bg_color)
+        
+        if indices:
+            ratios = _batch_contrast_ratios(np.array(fg_keys, dtype=np.int64),
+                                            np.array(bg_keys, dtype=np.int64))
+            
+            for index, ratio in zip(indices, ratios.tolist()):
+                data = color_data[index]
+                font_size = data.get('font_size')
+                is_bold = data.get('is_bold', False)
+                results[index] = ContrastResult(
+                    foreground_color=data.get('foreground', '#000000'),
+                    background_color=data.get('background', '#ffffff'),
+                    contrast_ratio=round(ratio, 2),
+                    meets_aa_normal=ratio >= self.AA_NORMAL_RATIO,
+                    meets_aa_large=ratio >= self.AA_LARGE_RATIO,
+                    meets_aaa_normal=ratio >= self.AAA_NORMAL_RATIO,
+                    meets_aaa_large=ratio >= self.AAA_LARGE_RATIO,
+                    element_type=data.get('element_type', 'text'),
+                    text_content=data.get('text_content'),
+                    font_size=font_size,
+                    is_bold=is_bold,
+                    is_large_text=self._is_large_text(font_size, is_bold)
+                )
+            
+            self.logger.debug(f"Checked {len(indices)} color pairs in one vectorized pass")
         
         return results
     
@@ -157,19 +396,13 @@ class ContrastChecker:
         Returns:
             List of issues with recommendations
         """
-        issues = []
-        
-        for result in results:
-            # Determine if this is large text
-            is_large = self._is_large_text(result.font_size, result.is_bold)
-            
-            # Check AA compliance (required for UNL)
-            if is_large and not result.meets_aa_large:
-                issues.append(self._create_issue(result, "AA Large Text", is_large))
-            elif not is_large and not result.meets_aa_normal:
-                issues.append(self._create_issue(result, "AA Normal Text", is_large))
-        
-        return issues
+        # AA compliance (required for UNL) against the size class fixed at check time
+        return [
+            self._create_issue(result, "AA Large Text" if result.is_large_text else "AA Normal Text",
+                               result.is_large_text)
+            for result in results
+            if not (result.meets_aa_large if result.is_large_text else result.meets_aa_normal)
+        ]
     
     def suggest_color_fixes(self, result: ContrastResult) -> List[Dict[str, str]]:
         """
@@ -184,18 +417,21 @@ class ContrastChecker:
         suggestions = []
         
         try:
-            fg_color = self._parse_color(result.foreground_color)
-            bg_color = self._parse_color(result.background_color)
+            fg_color = _parse_color(result.foreground_color)
+            bg_color = _parse_color(result.background_color)
             
-            if not fg_color or not bg_color:
+            if fg_color is None or bg_color is None:
                 return suggestions
             
             # Determine target ratio based on text size
-            is_large = self._is_large_text(result.font_size, result.is_bold)
-            target_ratio = self.AA_LARGE_RATIO if is_large else self.AA_NORMAL_RATIO
+            target_ratio = self.AA_LARGE_RATIO if result.is_large_text else self.AA_NORMAL_RATIO
+            
+            # Each color is the fixed anchor for the other's search, so compute both once
+            fg_lum = _packed_luminance(fg_color)
+            bg_lum = _packed_luminance(bg_color)
             
             # Try darkening foreground
-            darker_fg = self._adjust_brightness(fg_color, target_ratio, bg_color, darken=True)
+            darker_fg = self._solve_brightness(fg_color, fg_lum, bg_lum, target_ratio, darken=True)
             if darker_fg:
                 suggestions.append({
                     "type": "darken_foreground",
@@ -205,7 +441,7 @@ class ContrastChecker:
                 })
             
             # Try lightening background
-            lighter_bg = self._adjust_brightness(bg_color, target_ratio, fg_color, darken=False)
+            lighter_bg = self._solve_brightness(bg_color, bg_lum, fg_lum, target_ratio, darken=False)
             if lighter_bg:
                 suggestions.append({
                     "type": "lighten_background",
@@ -223,76 +459,25 @@ class ContrastChecker:
         
         return suggestions
     
-    def _parse_color(self, color_str: str) -> Optional[Color]:
-        """Parse color string into Color object."""
-        try:
-            color_str = color_str.strip()
-            
-            # Handle hex colors
-            if color_str.startswith('#'):
-                return Color(color_str)
-            
-            # Handle rgb() format
-            if color_str.startswith('rgb'):
-                rgb_match = re.search(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color_str)
-                if rgb_match:
-                    r, g, b = map(int, rgb_match.groups())
-                    return Color(r/255, g/255, b/255)
-            
-            # Handle named colors
-            try:
-                return Color(color_str)
-            except ValueError:
-                pass
-            
-            # Default to black if parsing fails
-            self.logger.warning(f"Could not parse color: {color_str}")
-            return Color('#000000')
-            
-        except Exception as e:
-            self.logger.error(f"Color parsing error: {e}")
-            return None
-    
-    def _calculate_contrast_ratio(self, color1: Color, color2: Color) -> float:
+    def _calculate_contrast_ratio(self, color1: int, color2: int) -> float:
         """
         Calculate contrast ratio between two colors.
         
         Uses WCAG formula: (L1 + 0.05) / (L2 + 0.05)
         where L1 is lighter color luminance and L2 is darker color luminance.
         """
-        lum1 = self._get_relative_luminance(color1)
-        lum2 = self._get_relative_luminance(color2)
-        
-        # Ensure lighter color is in numerator
-        lighter = max(lum1, lum2)
-        darker = min(lum1, lum2)
-        
-        ratio = (lighter + 0.05) / (darker + 0.05)
-        return round(ratio, 2)
-    
-    def _get_relative_luminance(self, color: Color) -> float:
-        """Calculate relative luminance using WCAG formula."""
-        def gamma_correct(value):
-            if value <= 0.03928:
-                return value / 12.92
-            else:
-                return pow((value + 0.055) / 1.055, 2.4)
-        
-        r = gamma_correct(color.r)
-        g = gamma_correct(color.g)
-        b = gamma_correct(color.b)
+        # Identical colors never pass; skip the lookup entirely
+        if color1 == color2:
+            return 1.0
         
-        return 0.2126 * r + 0.7152 * g + 0.0722 * b
+        # The ratio is symmetric, so (a, b) and (b, a) share one cache entry
+        if color1 < color2:
+            return _packed_contrast_ratio(color1, color2)
+        return _packed_contrast_ratio(color2, color1)
     
     def _is_large_text(self, font_size: Optional[float], is_bold: bool) -> bool:
         """Determine if text qualifies as "large" per WCAG definition."""
-        if font_size is None:
-            return False
-        
-        if is_bold:
-            return font_size >= self.LARGE_TEXT_BOLD_SIZE
-        else:
-            return font_size >= self.LARGE_TEXT_SIZE
+        return font_size is not None and font_size >= self._LARGE_TEXT_THRESHOLDS[bool(is_bold)]
     
     def _get_compliance_status(self, result: ContrastResult, is_large_text: bool) -> str:
         """Get human-readable compliance status."""
@@ -338,54 +523,66 @@ class ContrastChecker:
             "is_large_text": is_large
         }
     
-    def _adjust_brightness(self, color: Color, target_ratio: float, 
-                          other_color: Color, darken: bool) -> Optional[str]:
-        """Attempt to adjust color brightness to meet target contrast ratio."""
+    def _solve_brightness(self, color: int, color_lum: float, other_lum: float,
+                          target_ratio: float, darken: bool) -> Optional[str]:
+        """
+        Find the smallest brightness change that meets the target contrast ratio.
+        
+        Blends the color toward black (darken) or white and bisects on the
+        blend amount. Once the blend passes the other color's luminance the
+        ratio only grows, so the passing blends form one interval ending at
+        pure black/white and bisection finds its start.
+        
+        Candidates are scored against the precomputed anchor luminance rather
+        than through the pair cache, which they would only flood with
+        one-off entries.
+        
+        Args:
+            color: Packed color to adjust
+            color_lum: Relative luminance of color
+            other_lum: Relative luminance of the color it must contrast with
+            target_ratio: Required contrast ratio
+            darken: Blend toward black (True) or white (False)
+        
+        Returns:
+            Adjusted hex color, or None if no adjustment is needed or possible
+        """
         try:
-            current_ratio = self._calculate_contrast_ratio(color, other_color)
-            
-            if current_ratio >= target_ratio:
+            if _contrast_from_luminance(color_lum, other_lum) >= target_ratio:
                 return None  # Already meets requirement
             
-            # Try adjusting in steps
-            for factor in [0.8, 0.6, 0.4, 0.2] if darken else [1.2, 1.4, 1.6, 1.8]:
-                if darken:
-                    adjusted = Color(
-                        min(1.0, max(0.0, color.r * factor)),
-                        min(1.0, max(0.0, color.g * factor)),
-                        min(1.0, max(0.0, color.b * factor))
-                    )
+            endpoint = 0 if darken else 255
+            r, g, b = _unpack_rgb(color)
+            
+            # Candidates stay packed ints; only the returned color is formatted
+            def blend(amount: float) -> int:
+                return ((round(r + (endpoint - r) * amount) << 16) |
+                        (round(g + (endpoint - g) * amount) << 8) |
+                        round(b + (endpoint - b) * amount))
+            
+            best = _pack_rgb(endpoint, endpoint, endpoint)
+            if _contrast_from_luminance(_packed_luminance(best), other_lum) < target_ratio:
+                return None  # Even pure black/white falls short
+            
+            low, high = 0.0, 1.0
+            for _ in range(self.BRIGHTNESS_SEARCH_STEPS):
+                mid = (low + high) / 2
+                candidate = blend(mid)
+                ratio = _contrast_from_luminance(_packed_luminance(candidate), other_lum)
+                if ratio >= target_ratio:
+                    high, best = mid, candidate
+                    if ratio <= target_ratio * 1.01:
+                        break  # Within 1% of the target
                 else:
-                    adjusted = Color(
-                        min(1.0, color.r + (1 - color.r) * (factor - 1)),
-                        min(1.0, color.g + (1 - color.g) * (factor - 1)),
-                        min(1.0, color.b + (1 - color.b) * (factor - 1))
-                    )
-                
-                new_ratio = self._calculate_contrast_ratio(adjusted, other_color)
-                if new_ratio >= target_ratio:
-                    return f"#{int(adjusted.r*255):02x}{int(adjusted.g*255):02x}{int(adjusted.b*255):02x}"
+                    low = mid
             
-            return None
+            return _format_hex(best)
             
         except Exception:
             return None
     
     def _get_high_contrast_alternatives(self, result: ContrastResult) -> List[Dict[str, str]]:
         """Get high contrast color alternatives."""
-        return [
-            {
-                "type": "high_contrast",
-                "description": "Use black text on white background",
-                "original_color": result.foreground_color,
-                "suggested_color": "#000000",
-                "background_color": "#ffffff"
-            },
-            {
-                "type": "high_contrast", 
-                "description": "Use white text on dark background",
-                "original_color": result.foreground_color,
-                "suggested_color": "#ffffff",
-                "background_color": "#1a1a1a"
-            }
-        ]
\ No newline at end of file
+        # Fresh dicts, since callers may edit suggestions they are handed
+        return [{**template, "original_color": result.foreground_color}
+                for template in _HIGH_CONTRAST_TEMPLATES]
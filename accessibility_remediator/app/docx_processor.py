@@ -7,15 +7,25 @@ and provides recommendations for improvement.
 
 import os
 import json
+import posixpath
+import re
+import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 import logging
 
 # Word document processing
 try:
     from docx import Document
     from docx.shared import RGBColor, Pt
+    from docx.enum.dml import MSO_THEME_COLOR
     from docx.enum.style import WD_STYLE_TYPE
+    from docx.enum.text import WD_UNDERLINE
+    from docx.styles import BabelFish
+    from lxml import etree
 except ImportError as e:
     logging.warning(f"Word document processing libraries not available: {e}")
     Document = None
@@ -27,24 +37,294 @@ except ImportError:
     textstat = None
 
 from .contrast_checker import ContrastChecker
+from .readability import calculate_reading_level
+from .workers import worker_context
 
 logger = logging.getLogger(__name__)
 
+# WordprocessingML and package names used by the streaming (read-only) reader
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_PACKAGE_RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+# DrawingML names used to read image alt text
+_WP = "{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}"
+_WP_INLINE = _WP + "inline"
+_WP_ANCHOR = _WP + "anchor"
+_WP_DOC_PR = _WP + "docPr"
+_A_BLIP = "{http://schemas.openxmlformats.org/drawingml/2006/main}blip"
+_R_EMBED = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
+_ADEC_DECORATIVE = "{http://schemas.microsoft.com/office/drawing/2017/decorative}decorative"
+
+_W_BODY = _W + "body"
+_W_P = _W + "p"
+_W_R = _W + "r"
+_W_T = _W + "t"
+_W_BR = _W + "br"
+_W_TC = _W + "tc"
+_W_TR = _W + "tr"
+_W_TBL = _W + "tbl"
+_W_SECT_PR = _W + "sectPr"
+_W_STYLE = _W + "style"
+_W_HYPERLINK = _W + "hyperlink"
+_W_VAL = _W + "val"
+_W_TYPE = _W + "type"
+_W_STYLE_ID = _W + "styleId"
+_W_DEFAULT = _W + "default"
+_W_CUSTOM_STYLE = _W + "customStyle"
+_W_THEME_COLOR = _W + "themeColor"
+_W_ASCII = _W + "ascii"
+
+_W_PARA_STYLE = f"{_W}pPr/{_W}pStyle"
+_W_PARA_SECT_PR = f"{_W}pPr/{_W}sectPr"
+_W_STYLE_NAME = f"{_W}name"
+_W_GRID_COL = f"{_W}tblGrid/{_W}gridCol"
+_W_RUN_PROPERTIES = _W + "rPr"
+_W_RUN_BOLD = f"{_W}rPr/{_W}b"
+_W_RUN_SIZE = f"{_W}rPr/{_W}sz"
+
+# Run property children read for run info
+_W_FONTS = _W + "rFonts"
+_W_SIZE = _W + "sz"
+_W_BOLD = _W + "b"
+_W_ITALIC = _W + "i"
+_W_UNDERLINE = _W + "u"
+_W_COLOR = _W + "color"
+
+# Characters python-docx substitutes for these run children in Run.text
+_RUN_TEXT_CHARS = {
+    _W + "tab": "\t",
+    _W + "ptab": "\t",
+    _W + "cr": "\n",
+    _W + "noBreakHyphen": "-",
+}
+_ON_VALUES = frozenset(("1", "true", "on"))
+
+# Built-in heading style names ("Heading 1" ... "Heading 9")
+_HEADING_LEVEL_RE = re.compile(r"Heading\s+(\d+)\s*$")
+
+# Leading characters of manually typed list items
+_BULLET_CHARS = frozenset("•-*●◦▪")
+
+_XML_PARSER = (
+    etree.XMLParser(resolve_entities=False, remove_comments=True, remove_pis=True)
+    if Document is not None else None
+)
+
+# Smallest font size left in place by apply_fixes; a Length (integer EMU)
+# so run sizes compare without a float conversion
+_MIN_FONT_SIZE = Pt(10) if Document is not None else None
+
+# Issue definitions by key; checks record (key, context) and the "issue"
+# text is formatted with the context when the result is built
+_ISSUE_TEMPLATES = {
+    "missing_title": {
+        "type": "structure",
+        "severity": "high",
+        "issue": "Missing document title",
+        "description": "Document should have a descriptive title in properties",
+        "recommendation": "Add a descriptive title in File > Info > Properties",
+        "wcag_criterion": "2.4.2 Page Titled"
+    },
+    "missing_language": {
+        "type": "structure",
+        "severity": "high",
+        "issue": "Missing document language",
+        "description": "Document should specify its primary language",
+        "recommendation": "Set document language in Review > Language",
+        "wcag_criterion": "3.1.1 Language of Page"
+    },
+    "missing_headings": {
+        "type": "structure",
+        "severity": "medium",
+        "issue": "Missing heading structure",
+        "description": "Long documents should use headings to organize content",
+        "recommendation": "Use Heading 1, Heading 2, etc. styles to structure content",
+        "wcag_criterion": "1.3.1 Info and Relationships"
+    },
+    "improper_hierarchy": {
+        "type": "structure",
+        "severity": "medium",
+        "issue": "Improper heading hierarchy",
+        "description": "Heading levels should not skip (e.g., H1 directly to H3)",
+        "recommendation": "Use sequential heading levels (H1, H2, H3, etc.)",
+        "wcag_criterion": "1.3.1 Info and Relationships"
+    },
+    "all_caps": {
+        "type": "text",
+        "severity": "medium",
+        "issue": "{count} paragraphs in all caps",
+        "description": "All caps text is harder to read and may be interpreted as shouting",
+        "recommendation": "Use sentence case with bold or emphasis for importance",
+        "wcag_criterion": "1.4.8 Visual Presentation"
+    },
+    "small_text": {
+        "type": "text",
+        "severity": "medium",
+        "issue": "{count} instances of small text (< 10pt)",
+        "description": "Very small text may be difficult for some users to read",
+        "recommendation": "Use minimum 10pt font size, preferably 12pt or larger",
+        "wcag_criterion": "1.4.12 Text Spacing"
+    },
+    "complex_reading_level": {
+        "type": "text",
+        "severity": "low",
+        "issue": "Complex reading level: Grade {grade:.1f}",
+        "description": "Content may be difficult for some users to understand",
+        "recommendation": "Consider simplifying language where appropriate",
+        "wcag_criterion": "3.1.5 Reading Level"
+    },
+    "image_missing_alt_text": {
+        "type": "images",
+        "severity": "high",
+        "issue": "Image '{filename}' missing alternative text",
+        "description": "Images need alternative text for screen readers",
+        "recommendation": "Right-click image > Format Picture > Alt Text and add description",
+        "wcag_criterion": "1.1.1 Non-text Content"
+    },
+    "table_missing_header": {
+        "type": "tables",
+        "severity": "medium",
+        "issue": "Table {number} missing header row",
+        "description": "Tables should have header rows to identify columns",
+        "recommendation": "Select first row and use Table Design > Header Row",
+        "wcag_criterion": "1.3.1 Info and Relationships"
+    },
+    "missing_heading_1": {
+        "type": "structure",
+        "severity": "medium",
+        "issue": "Document doesn't start with Heading 1",
+        "description": "Documents should typically start with a Heading 1",
+        "recommendation": "Use Heading 1 for the main document title",
+        "wcag_criterion": "1.3.1 Info and Relationships"
+    },
+    "only_normal_style": {
+        "type": "structure",
+        "severity": "medium",
+        "issue": "Only Normal style used",
+        "description": "Using only Normal style makes content structure unclear",
+        "recommendation": "Use Heading styles and other built-in styles for structure",
+        "wcag_criterion": "1.3.1 Info and Relationships"
+    }
+}
+
+
+@lru_cache(maxsize=1024)
+def _style_kind(style_name: Optional[str]) -> Tuple[bool, Optional[int], bool]:
+    """
+    Classify a paragraph style name as (is_toc, heading_level, is_list)
+    
+    Documents reuse a handful of style names across thousands of paragraphs,
+    so the prefix checks and heading-level parse run once per distinct name.
+    heading_level is None for non-heading styles and for "Heading" styles
+    without a numeric level (e.g. "Heading 1 Char"). Unnamed styles
+    (None) classify as plain paragraphs.
+    """
+    if not style_name:
+        return False, None, False
+    
+    heading_level = None
+    if style_name.startswith('Heading'):
+        match = _HEADING_LEVEL_RE.match(style_name)
+        if match:
+            heading_level = int(match.group(1))
+    return style_name.startswith('TOC'), heading_level, style_name.startswith('List')
+
+
+def _xml_on_off(element) -> Optional[bool]:
+    """Read a toggle property such as <w:b/>: None when absent, True when it has no w:val"""
+    if element is None:
+        return None
+    val = element.get(_W_VAL)
+    return val is None or val in _ON_VALUES
+
+
+def _xml_font_size(size) -> Optional[float]:
+    """Point size from a <w:sz> element (stored in half-points), or None"""
+    if size is None:
+        return None
+    try:
+        return int(size.get(_W_VAL)) / 2.0 or None
+    except (TypeError, ValueError):
+        return None
+
+
+def _xml_collect_image_alt_text(element, alt_texts: Dict[str, Tuple[str, bool]]):
+    """
+    Record (alt text, decorative) by image relationship ID for the drawings under element
+    
+    Alt text is the drawing's wp:docPr description, else its title. When an
+    image is placed more than once, the first placement with alt text supplies it.
+    """
+    for drawing in element.iter(_WP_INLINE, _WP_ANCHOR):
+        blip = next(drawing.iter(_A_BLIP), None)
+        doc_pr = drawing.find(_WP_DOC_PR)
+        rel_id = blip.get(_R_EMBED) if blip is not None else None
+        if not rel_id or doc_pr is None:
+            continue
+        
+        alt_text = (doc_pr.get("descr") or doc_pr.get("title") or "").strip()
+        decorative = any(mark.get("val") in _ON_VALUES for mark in doc_pr.iter(_ADEC_DECORATIVE))
+        previous_alt_text, previous_decorative = alt_texts.get(rel_id, ("", False))
+        alt_texts[rel_id] = (previous_alt_text or alt_text, previous_decorative or decorative)
+
+
+def _xml_run_text(run) -> str:
+    """Text of a <w:r> element, with tabs and breaks mapped as python-docx does"""
+    text = []
+    for child in run:
+        tag = child.tag
+        if tag == _W_T:
+            text.append(child.text or "")
+        elif tag == _W_BR:
+            if child.get(_W_TYPE, "textWrapping") == "textWrapping":
+                text.append("\n")
+        elif tag in _RUN_TEXT_CHARS:
+            text.append(_RUN_TEXT_CHARS[tag])
+    return "".join(text)
+
+
+def _xml_paragraph_text(paragraph) -> str:
+    """Text of a <w:p> element, including the visible text of its hyperlinks"""
+    text = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            text.append(_xml_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            text.extend(_xml_run_text(run) for run in child.iterchildren(_W_R))
+    return "".join(text)
+
+
 class DocxAccessibilityProcessor:
     """Analyzes Word documents (.docx) for accessibility compliance"""
     
+    # Environment variable overriding the analyze_many worker count
+    WORKERS_ENV_VAR = "DOCX_ANALYSIS_THREADS"
+    
     def __init__(self):
         self.contrast_checker = ContrastChecker()
         self.issues = []
         self.fixes_applied = []
         
-    def analyze_docx(self, file_path: str, apply_fixes: bool = False) -> Dict[str, Any]:
+    def analyze_docx(self, file_path: str, apply_fixes: bool = False, quick: bool = False) -> Dict[str, Any]:
         """
         Analyze a Word document for accessibility issues
         
+        Read-only analysis streams the package XML directly; python-docx is
+        only loaded when apply_fixes needs to modify and save the document.
+        The fixes and the save of the fixed copy then run in a worker thread
+        while the checks run on the already extracted content.
+        
+        Quick analysis is meant for pre-screening large batches: it checks
+        metadata, headings, styles, all caps and reading level, but skips
+        run formatting, tables and image alt text. Images and tables are
+        only counted (document_info "images"/"tables"), and the result is
+        flagged with "quick_analysis".
+        
         Args:
             file_path: Path to the .docx file
             apply_fixes: Whether to attempt automatic fixes
+            quick: Skip run, table and image analysis (ignored with apply_fixes)
             
         Returns:
             Dictionary containing analysis results
@@ -63,82 +343,469 @@ class DocxAccessibilityProcessor:
             if not os.path.exists(file_path):
                 return self._create_error_result(f"File not found: {file_path}")
             
-            # Open and analyze Word document
-            doc = Document(file_path)
-            
-            doc_info = self._extract_document_info(doc)
-            text_content = self._extract_text_content(doc)
-            images = self._extract_images(doc)
-            structure = self._analyze_structure(doc)
-            styles = self._analyze_styles(doc)
-            tables = self._analyze_tables(doc)
-            
-            # Perform accessibility checks
-            self._check_document_structure(doc_info, structure)
-            self._check_text_accessibility(text_content, styles)
-            self._check_image_accessibility(images)
-            self._check_table_accessibility(tables)
-            self._check_heading_structure(structure)
-            self._check_style_accessibility(styles)
+            # Open and analyze Word document; the checks only read run font
+            # sizes, so full run formatting is only gathered for apply_fixes
+            doc = None
+            quick = quick and not apply_fixes
+            if apply_fixes:
+                doc = Document(file_path)
+                parts = self._read_docx(doc)
+            else:
+                try:
+                    parts = self._read_docx_stream(file_path, run_details=False, quick=quick)
+                except Exception as e:
+                    logger.warning(f"Streaming read failed, falling back to python-docx: {str(e)}")
+                    doc = Document(file_path)
+                    parts = self._read_docx(doc, run_details=False)
+                    quick = False
             
-            # Calculate accessibility score
-            score = self._calculate_accessibility_score()
+            doc_info = parts["doc_info"]
+            text_content = parts["text_content"]
+            images = parts["images"]
+            structure = parts["structure"]
+            styles = parts["styles"]
+            tables = parts["tables"]
             
-            # Apply fixes if requested
+            # Apply fixes if requested; they only touch doc and
+            # self.fixes_applied, so the save's ZIP compression overlaps
+            # with the checks below
+            fixes = None
             if apply_fixes:
-                output_path = self._apply_automatic_fixes(file_path, doc)
-            else:
-                output_path = None
+                fix_executor = ThreadPoolExecutor(max_workers=1)
+                fixes = fix_executor.submit(self._apply_automatic_fixes, file_path, doc)
+                fix_executor.shutdown(wait=False)
+            
+            try:
+                # Perform accessibility checks
+                self._check_document_structure(doc_info, structure)
+                self._check_text_accessibility(text_content, styles)
+                self._check_image_accessibility(images)
+                self._check_table_accessibility(tables)
+                self._check_heading_structure(structure)
+                self._check_style_accessibility(styles)
+                
+                # Tally issues by severity once for the score and summary
+                severity_counts = self._count_severities()
+                
+                # Calculate accessibility score
+                score = self._calculate_accessibility_score(severity_counts)
+            finally:
+                # Never return while the fixed copy is still being written
+                output_path = fixes.result() if fixes else None
             
             return self._create_analysis_result(
                 file_path=file_path,
                 output_path=output_path,
                 score=score,
-                doc_info=doc_info,
-                text_content=text_content,
-                images=images,
-                structure=structure,
-                styles=styles,
-                tables=tables
+                severity_counts=severity_counts,
+                quick=quick,
+                **parts
             )
             
         except Exception as e:
             logger.error(f"Error analyzing Word document: {str(e)}")
             return self._create_error_result(f"Analysis failed: {str(e)}")
     
+    def analyze_many(self, file_paths: List[str], apply_fixes: bool = False,
+                     workers: Optional[int] = None, use_threads: bool = False,
+                     quick: bool = False) -> List[Dict[str, Any]]:
+        """
+        Analyze several Word documents in parallel
+        
+        XML parsing and readability scoring are CPU-bound, so documents are
+        spread across worker processes from workers.worker_context, each
+        with its own processor. Set use_threads for storage-bound batches
+        (e.g. a network share) where waiting on reads outweighs the parsing
+        work.
+        
+        Args:
+            file_paths: Paths to the .docx files
+            apply_fixes: Whether to attempt automatic fixes
+            workers: Worker count (default DOCX_ANALYSIS_THREADS, else CPU count - 1)
+            use_threads: Use a thread pool instead of a process pool
+            quick: Quick analysis for each document (see analyze_docx)
+            
+        Returns:
+            List of analysis results in the same order as file_paths
+        """
+        jobs = [(file_path, apply_fixes, quick) for file_path in file_paths]
+        workers = min(self._get_worker_count(workers), len(jobs))
+        
+        if workers <= 1:
+            return [_analyze_docx_job(job) for job in jobs]
+        
+        logger.info(f"Analyzing {len(jobs)} Word documents with {workers} "
+                    f"{'threads' if use_threads else 'processes'}")
+        if use_threads:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_analyze_docx_job, jobs))
+        
+        with worker_context().Pool(workers) as pool:
+            return pool.map(_analyze_docx_job, jobs)
+    
+    def read_metadata(self, file_path: str) -> Dict[str, Any]:
+        """
+        Read a Word document's core properties without analyzing it
+        
+        For metadata-only pre-screens (e.g. finding documents without a title
+        or language): only the package relationships and docProps/core.xml
+        are parsed, so word/document.xml is never read.
+        
+        Args:
+            file_path: Path to the .docx file
+            
+        Returns:
+            Dictionary of title, author, subject and language
+            
+        Raises:
+            RuntimeError: If python-docx/lxml are not available
+            OSError, zipfile.BadZipFile: If the file cannot be opened as a package
+        """
+        if not Document:
+            raise RuntimeError("python-docx library not available")
+        
+        with zipfile.ZipFile(file_path) as package:
+            core_part = next((part for _, rel_type, _, part in self._read_part_rels(package, "")
+                              if rel_type.endswith("/core-properties")), None)
+            info = self._extract_xml_document_info(package, core_part)
+        
+        return {key: info[key] for key in ("title", "author", "subject", "language")}
+    
+    def _get_worker_count(self, workers: Optional[int]) -> int:
+        """Worker count for analyze_many: explicit value, environment override, else CPU count - 1"""
+        if workers:
+            return max(1, workers)
+        
+        configured = os.environ.get(self.WORKERS_ENV_VAR)
+        if configured:
+            try:
+                return max(1, int(configured))
+            except ValueError:
+                logger.warning(f"Ignoring invalid {self.WORKERS_ENV_VAR} value: {configured!r}")
+        
+        return max(1, (os.cpu_count() or 1) - 1)
+    
+    def _read_docx(self, doc: Document, run_details: bool = True) -> Dict[str, Any]:
+        """Collect everything the checks need from an open python-docx Document
+        
+        run_details is passed through to _iter_paragraphs.
+        """
+        doc_info = self._extract_document_info(doc)
+        styles = self._analyze_styles(self._iter_styles(doc))
+        text_content, structure = self._scan_paragraphs(self._iter_paragraphs(doc, run_details), doc_info, styles)
+        image_alt_text = {}
+        _xml_collect_image_alt_text(doc.element.body, image_alt_text)
+        
+        return {
+            "doc_info": doc_info,
+            "text_content": text_content,
+            "images": self._extract_images(
+                ((rel.rId, rel.target_ref) for rel in doc.part.rels.values()), image_alt_text
+            ),
+            "structure": structure,
+            "styles": styles,
+            "tables": self._analyze_tables(doc)
+        }
+    
+    def _read_docx_stream(self, file_path: str, run_details: bool = True, quick: bool = False) -> Dict[str, Any]:
+        """
+        Collect everything the checks need straight from the package XML
+        
+        word/document.xml is streamed with lxml iterparse rather than loaded
+        into python-docx's object model: each body-level paragraph or table is
+        summarized as soon as it closes, then cleared along with its earlier
+        siblings, so memory stays flat however long the document is. Produces
+        the same dictionaries as _read_docx.
+        
+        In quick mode runs, tables and image alt text are not read: images
+        and tables come back empty and are only counted into
+        doc_info["images"] and doc_info["tables"].
+        
+        Args:
+            file_path: Path to the .docx file
+            run_details: Whether run info includes full formatting (see _iter_paragraphs)
+            quick: Skip run, table and image analysis
+            
+        Returns:
+            Dictionary of doc_info, text_content, images, structure, styles and tables
+        """
+        with zipfile.ZipFile(file_path) as package:
+            package_rels = self._read_part_rels(package, "")
+            document_part = next(part for _, rel_type, _, part in package_rels
+                                 if rel_type.endswith("/officeDocument"))
+            core_part = next((part for _, rel_type, _, part in package_rels
+                              if rel_type.endswith("/core-properties")), None)
+            document_rels = self._read_part_rels(package, document_part)
+            styles_part = next((part for _, rel_type, _, part in document_rels
+                                if rel_type.endswith("/styles")), None)
+            
+            doc_info = self._extract_xml_document_info(package, core_part)
+            
+            styles_root = None
+            if styles_part and styles_part in package.NameToInfo:
+                styles_root = etree.fromstring(package.read(styles_part), _XML_PARSER)
+            style_list, paragraph_styles, default_style = self._read_xml_styles(styles_root)
+            styles = self._analyze_styles(style_list)
+            
+            tables = []
+            image_alt_text = {}
+            with package.open(document_part) as stream:
+                text_content, structure = self._scan_paragraphs(
+                    self._iter_xml_paragraphs(stream, paragraph_styles, default_style, doc_info, tables,
+                                              image_alt_text, run_details, quick),
+                    doc_info,
+                    styles
+                )
+        
+        image_rels = ((rel_id, target_ref) for rel_id, _, target_ref, _ in document_rels)
+        if quick:
+            doc_info["images"] = sum(1 for _, target_ref in image_rels if "image" in target_ref)
+            images = []
+        else:
+            images = self._extract_images(image_rels, image_alt_text)
+        
+        return {
+            "doc_info": doc_info,
+            "text_content": text_content,
+            "images": images,
+            "structure": structure,
+            "styles": styles,
+            "tables": tables
+        }
+    
+    def _read_part_rels(self, package: "zipfile.ZipFile",
+                        part_name: str) -> List[Tuple[str, str, str, Optional[str]]]:
+        """
+        Read the relationships of a package part
+        
+        Args:
+            package: Open .docx zip archive
+            part_name: Part whose relationships to read ("" for the package itself)
+            
+        Returns:
+            List of (relationship ID, relationship type, target as written,
+            zip member name) tuples; the member name is None for external targets
+        """
+        directory, name = posixpath.split(part_name)
+        rels_name = posixpath.join(directory, "_rels", f"{name}.rels")
+        if rels_name not in package.NameToInfo:
+            return []
+        
+        rels = []
+        for rel in etree.fromstring(package.read(rels_name), _XML_PARSER).iterchildren(_PACKAGE_RELATIONSHIP):
+            target_ref = rel.get("Target", "")
+            if rel.get("TargetMode") == "External":
+                part = None
+            elif target_ref.startswith("/"):
+                part = target_ref[1:]
+            else:
+                part = posixpath.normpath(posixpath.join(directory, target_ref))
+            rels.append((rel.get("Id", ""), rel.get("Type", ""), target_ref, part))
+        return rels
+    
     def _extract_document_info(self, doc: Document) -> Dict[str, Any]:
-        """Extract basic document metadata and properties"""
+        """Extract basic document metadata and properties
+        
+        Paragraph-derived fields ("paragraphs", "has_toc") are filled in by
+        _scan_paragraphs.
+        """
         info = {
             "title": None,
             "author": None,
             "subject": None,
-            "paragraphs": len(doc.paragraphs),
+            "paragraphs": 0,
             "sections": len(doc.sections),
             "has_toc": False,
             "language": None
         }
         
         try:
-            # Core document properties
-            if doc.core_properties:
-                info["title"] = doc.core_properties.title
-                info["author"] = doc.core_properties.author
-                info["subject"] = doc.core_properties.subject
-                info["language"] = doc.core_properties.language
-            
-            # Check for table of contents (simplified check)
-            for para in doc.paragraphs:
-                if para.style.name.startswith('TOC'):
-                    info["has_toc"] = True
-                    break
-                    
+            # Core document properties (each access re-resolves the part)
+            core_properties = doc.core_properties
+            if core_properties:
+                info["title"] = core_properties.title
+                info["author"] = core_properties.author
+                info["subject"] = core_properties.subject
+                info["language"] = core_properties.language
+            
         except Exception as e:
             logger.warning(f"Error extracting document info: {str(e)}")
         
         return info
     
-    def _extract_text_content(self, doc: Document) -> Dict[str, Any]:
-        """Extract and analyze text content"""
+    def _extract_xml_document_info(self, package: "zipfile.ZipFile", core_part: Optional[str]) -> Dict[str, Any]:
+        """Streaming counterpart of _extract_document_info, reading docProps/core.xml
+        
+        "sections" is counted by _iter_xml_paragraphs as the body streams past.
+        """
+        info = {
+            "title": None,
+            "author": None,
+            "subject": None,
+            "paragraphs": 0,
+            "sections": 0,
+            "has_toc": False,
+            "language": None
+        }
+        
+        try:
+            if core_part and core_part in package.NameToInfo:
+                core = etree.fromstring(package.read(core_part), _XML_PARSER)
+                info["title"] = core.findtext(_DC + "title") or ""
+                info["author"] = core.findtext(_DC + "creator") or ""
+                info["subject"] = core.findtext(_DC + "subject") or ""
+                info["language"] = core.findtext(_DC + "language") or ""
+                
+        except Exception as e:
+            logger.warning(f"Error extracting document info: {str(e)}")
+        
+        return info
+    
+    def _iter_paragraphs(self, doc: Document,
+                         run_details: bool = True) -> Iterator[Tuple[str, bool, str, List[Dict[str, Any]]]]:
+        """
+        Yield (style_name, styled, text, runs) for each body paragraph of a python-docx Document
+        
+        runs holds formatting info for the non-blank runs of non-blank
+        paragraphs; styled is False when the paragraph has no style at all.
+        Without run_details each run only carries "text" and "font_size",
+        the one property the checks read, so the other font lookups (each
+        resolved through the run's XML) are skipped.
+        """
+        for para in doc.paragraphs:
+            style = para.style
+            text = para.text
+            runs = []
+            
+            if text.strip():
+                for run in para.runs:
+                    run_text = run.text
+                    if not run_text.strip():
+                        continue
+                    font = run.font
+                    size = font.size
+                    if run_details:
+                        runs.append({
+                            "text": run_text,
+                            "font_name": font.name,
+                            "font_size": size.pt if size else None,
+                            "bold": font.bold,
+                            "italic": font.italic,
+                            "underline": font.underline,
+                            "color": self._get_color_info(font.color)
+                        })
+                    else:
+                        runs.append({"text": run_text, "font_size": size.pt if size else None})
+            
+            yield (style.name if style else "Normal", bool(style), text, runs)
+    
+    def _iter_xml_paragraphs(self, stream, paragraph_styles: Dict[str, Optional[str]],
+                             default_style: Tuple[Optional[str], bool], doc_info: Dict[str, Any],
+                             tables: List[Dict[str, Any]],
+                             image_alt_text: Dict[str, Tuple[str, bool]],
+                             run_details: bool = True,
+                             quick: bool = False) -> Iterator[Tuple[str, bool, str, List[Dict[str, Any]]]]:
+        """
+        Streaming counterpart of _iter_paragraphs over word/document.xml
+        
+        Body-level tables are analyzed into tables, section breaks are
+        counted into doc_info["sections"] and image alt text from every
+        body-level element is collected into image_alt_text as they stream
+        past, so all three are complete once the generator is exhausted.
+        
+        Args:
+            stream: Binary file object for the main document part
+            paragraph_styles: Paragraph style names by style ID
+            default_style: (name, styled) used for paragraphs without a known style
+            doc_info: Document info dictionary receiving the section count
+            tables: List receiving table info dictionaries
+            image_alt_text: Dictionary receiving (alt text, decorative) by image relationship ID
+            run_details: Whether run info includes full formatting (see _iter_paragraphs)
+            quick: Yield paragraphs without runs, count tables into
+                doc_info["tables"] instead of analyzing them, and skip alt text
+        """
+        if quick:
+            doc_info["tables"] = 0
+        
+        for _, elem in etree.iterparse(stream, events=("end",), tag=(_W_P, _W_TBL, _W_SECT_PR),
+                                       remove_comments=True, remove_pis=True,
+                                       resolve_entities=False, huge_tree=False):
+            body = elem.getparent()
+            if body is None or body.tag != _W_BODY:
+                # Paragraphs in table cells and per-paragraph section properties
+                # are handled with their body-level ancestor
+                continue
+            
+            paragraph = None
+            if elem.tag != _W_SECT_PR and not quick:
+                _xml_collect_image_alt_text(elem, image_alt_text)
+            
+            if elem.tag == _W_P:
+                if elem.find(_W_PARA_SECT_PR) is not None:
+                    doc_info["sections"] += 1
+                
+                p_style = elem.find(_W_PARA_STYLE)
+                style_id = p_style.get(_W_VAL) if p_style is not None else None
+                if style_id in paragraph_styles:
+                    style_name, styled = paragraph_styles[style_id], True
+                else:
+                    style_name, styled = default_style
+                
+                text = _xml_paragraph_text(elem)
+                runs = []
+                if not quick and text.strip():
+                    for run in elem.iterchildren(_W_R):
+                        run_text = _xml_run_text(run)
+                        if not run_text.strip():
+                            continue
+                        if run_details:
+                            runs.append(self._get_xml_run_info(run, run_text))
+                        else:
+                            runs.append({"text": run_text, "font_size": _xml_font_size(run.find(_W_RUN_SIZE))})
+                
+                paragraph = (style_name, styled, text, runs)
+            elif elem.tag == _W_TBL:
+                if quick:
+                    doc_info["tables"] += 1
+                else:
+                    tables.append(self._analyze_xml_table(len(tables), elem))
+            else:
+                doc_info["sections"] += 1
+            
+            # Drop the handled element and everything before it. Other
+            # body-level children, such as content controls (w:sdt) wrapping
+            # a cover page, aren't streamed, so their images are read here
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                if not quick:
+                    _xml_collect_image_alt_text(body[0], image_alt_text)
+                del body[0]
+            
+            if paragraph is not None:
+                yield paragraph
+    
+    def _scan_paragraphs(self, paragraphs: Iterable[Tuple[str, bool, str, List[Dict[str, Any]]]],
+                         doc_info: Dict[str, Any],
+                         styles: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Walk the document body once, collecting text, structure and style usage
+        
+        Paragraphs come from _iter_paragraphs or _iter_xml_paragraphs, so each
+        is read exactly once and its style name, text and runs are reused by
+        every check. Errors from the paragraph source are not caught here, so
+        a streaming read that fails partway falls back to python-docx in
+        analyze_docx instead of yielding a truncated scan.
+        
+        Args:
+            paragraphs: (style_name, styled, text, runs) tuples in document order
+            doc_info: Dictionary from _extract_document_info; receives the
+                paragraph count and table of contents flag
+            styles: Dictionary from _analyze_styles; receives "used_styles"
+                (in order of first use) and "style_counts" (paragraphs per style)
+            
+        Returns:
+            Tuple of (text_content, structure) dictionaries
+        """
         content = {
             "paragraphs": [],
             "total_chars": 0,
@@ -147,179 +814,216 @@ class DocxAccessibilityProcessor:
             "all_caps_count": 0,
             "small_text_count": 0
         }
+        structure = {
+            "headings": [],
+            "heading_levels": [],
+            "has_proper_hierarchy": True,
+            "lists": [],
+            "links": []
+        }
+        style_counts = Counter()
+        text_parts = []
+        # Per-run/per-paragraph tallies stay in locals and are stored once
+        small_text_count = all_caps_count = total_chars = paragraph_count = 0
+        # Bound once so the loop doesn't re-resolve them per paragraph
+        add_heading = structure["headings"].append
+        add_heading_level = structure["heading_levels"].append
+        add_list = structure["lists"].append
+        add_paragraph = content["paragraphs"].append
+        add_text = text_parts.append
         
-        try:
-            full_text = ""
+        for para_idx, (style_name, styled, text, runs) in enumerate(paragraphs):
+            paragraph_count = para_idx + 1
+            para_text = text.strip()
             
-            for para_idx, para in enumerate(doc.paragraphs):
-                para_text = para.text.strip()
-                if not para_text:
-                    continue
-                
-                para_info = {
-                    "index": para_idx,
-                    "text": para_text,
-                    "style": para.style.name if para.style else "Normal",
-                    "char_count": len(para_text),
-                    "is_all_caps": para_text.isupper() and len(para_text) > 5,
-                    "runs": []
-                }
-                
-                # Analyze runs for formatting
-                for run in para.runs:
-                    if run.text.strip():
-                        run_info = {
-                            "text": run.text,
-                            "font_name": run.font.name,
-                            "font_size": run.font.size.pt if run.font.size else None,
-                            "bold": run.font.bold,
-                            "italic": run.font.italic,
-                            "underline": run.font.underline,
-                            "color": self._get_color_info(run.font.color)
-                        }
-                        para_info["runs"].append(run_info)
-                        
-                        # Check for small text
-                        if run_info["font_size"] and run_info["font_size"] < 10:
-                            content["small_text_count"] += 1
-                
-                # Check for all caps
-                if para_info["is_all_caps"]:
-                    content["all_caps_count"] += 1
-                
-                content["paragraphs"].append(para_info)
-                full_text += para_text + " "
-                content["total_chars"] += len(para_text)
+            is_toc, level, is_list_style = _style_kind(style_name)
+            
+            # Style usage and table of contents (simplified check)
+            if styled:
+                style_counts[style_name] += 1
+            if is_toc:
+                doc_info["has_toc"] = True
+            
+            # Check for headings
+            if level is not None:
+                add_heading({
+                    "text": text,
+                    "level": level,
+                    "style": style_name
+                })
+                add_heading_level(level)
+            
+            # Check for lists (basic detection)
+            if is_list_style or para_text[:1] in _BULLET_CHARS:
+                add_list({
+                    "text": text[:50] + "..." if len(text) > 50 else text,
+                    "style": style_name
+                })
+            
+            if not para_text:
+                continue
             
+            para_info = {
+                "index": para_idx,
+                "text": para_text,
+                "style": style_name,
+                "char_count": len(para_text),
+                "is_all_caps": len(para_text) > 5 and para_text.isupper(),
+                "runs": runs
+            }
+            
+            # Check for small text
+            for run_info in runs:
+                font_size = run_info["font_size"]
+                if font_size and font_size < 10:
+                    small_text_count += 1
+            
+            # Check for all caps
+            if para_info["is_all_caps"]:
+                all_caps_count += 1
+            
+            add_paragraph(para_info)
+            add_text(para_text)
+            total_chars += len(para_text)
+        
+        doc_info["paragraphs"] = paragraph_count
+        
+        # Check hierarchy (shouldn't skip levels) over consecutive headings
+        levels = structure["heading_levels"]
+        structure["has_proper_hierarchy"] = not any(
+            0 < previous < level - 1 for previous, level in zip(levels, levels[1:])
+        )
+        content["total_chars"] = total_chars
+        content["all_caps_count"] = all_caps_count
+        content["small_text_count"] = small_text_count
+        styles["used_styles"] = list(style_counts)
+        styles["style_counts"] = style_counts
+        full_text = " ".join(text_parts)
+        
+        try:
             # Calculate reading level if textstat is available
             if textstat and len(full_text) > 100:
-                content["reading_level"] = {
-                    "flesch_reading_ease": textstat.flesch_reading_ease(full_text),
-                    "flesch_kincaid_grade": textstat.flesch_kincaid_grade(full_text),
-                    "automated_readability_index": textstat.automated_readability_index(full_text)
-                }
+                content["reading_level"] = calculate_reading_level(full_text)
                 content["word_count"] = len(full_text.split())
             
         except Exception as e:
-            logger.warning(f"Error extracting text content: {str(e)}")
+            logger.warning(f"Error calculating reading level: {str(e)}")
         
-        return content
+        return content, structure
     
-    def _extract_images(self, doc: Document) -> List[Dict[str, Any]]:
-        """Extract and analyze images from document"""
+    def _extract_images(self, rels: Iterable[Tuple[str, str]],
+                        image_alt_text: Dict[str, Tuple[str, bool]]) -> List[Dict[str, Any]]:
+        """Extract and analyze images from the main document part's relationships
+        
+        Args:
+            rels: (relationship ID, target) pairs of the main document part
+            image_alt_text: (alt text, decorative) by relationship ID, from
+                _xml_collect_image_alt_text
+        """
         images = []
         
         try:
             # Get all relationships to find images
-            for rel in doc.part.rels.values():
-                if "image" in rel.target_ref:
+            for rel_id, target_ref in rels:
+                if "image" in target_ref:
+                    alt_text, is_decorative = image_alt_text.get(rel_id, ("", False))
                     image_info = {
-                        "filename": rel.target_ref.split('/')[-1],
-                        "has_alt_text": False,
-                        "alt_text": "",
-                        "is_decorative": False
+                        "filename": target_ref.split('/')[-1],
+                        "has_alt_text": bool(alt_text),
+                        "alt_text": alt_text,
+                        "is_decorative": is_decorative
                     }
                     images.append(image_info)
             
-            # Check inline shapes for alt text
-            for para in doc.paragraphs:
-                for run in para.runs:
-                    if run._element.xpath('.//pic:pic'):
-                        # This is a complex XPath query to find images with alt text
-                        # For simplicity, we'll mark as needing manual review
-                        pass
-            
         except Exception as e:
             logger.warning(f"Error extracting images: {str(e)}")
         
         return images
     
-    def _analyze_structure(self, doc: Document) -> Dict[str, Any]:
-        """Analyze document structure"""
-        structure = {
-            "headings": [],
-            "heading_levels": [],
-            "has_proper_hierarchy": True,
-            "lists": [],
-            "links": []
-        }
+    def _iter_styles(self, doc: Document) -> Iterator[Tuple[str, str, bool]]:
+        """Yield (name, type, builtin) for each style defined in a python-docx Document"""
+        for style in doc.styles:
+            yield (
+                style.name,
+                str(style.type) if hasattr(style, 'type') else "Unknown",
+                style.builtin if hasattr(style, 'builtin') else False
+            )
+    
+    def _read_xml_styles(self, root) -> Tuple[List[Tuple[str, str, bool]], Dict[str, Optional[str]],
+                                              Tuple[Optional[str], bool]]:
+        """
+        Read style definitions from a parsed word/styles.xml
         
-        try:
-            previous_level = 0
+        Style names, types and paragraph-style resolution follow python-docx:
+        the first style with a given ID wins, and the last paragraph style
+        flagged as default applies to unstyled paragraphs.
+        
+        Args:
+            root: Root element of the styles part, or None if the package has none
             
-            for para in doc.paragraphs:
-                style_name = para.style.name if para.style else "Normal"
-                
-                # Check for headings
-                if style_name.startswith('Heading'):
-                    try:
-                        level = int(style_name.split()[-1])
-                        structure["headings"].append({
-                            "text": para.text,
-                            "level": level,
-                            "style": style_name
-                        })
-                        structure["heading_levels"].append(level)
-                        
-                        # Check hierarchy (shouldn't skip levels)
-                        if previous_level > 0 and level > previous_level + 1:
-                            structure["has_proper_hierarchy"] = False
-                        previous_level = level
-                        
-                    except (ValueError, IndexError):
-                        pass
-                
-                # Check for lists (basic detection)
-                if style_name.startswith('List') or para.text.strip().startswith(('•', '-', '*')):
-                    structure["lists"].append({
-                        "text": para.text[:50] + "..." if len(para.text) > 50 else para.text,
-                        "style": style_name
-                    })
-                
-                # Check for hyperlinks
-                for run in para.runs:
-                    if hasattr(run, 'hyperlink') and run.hyperlink:
-                        structure["links"].append({
-                            "text": run.text,
-                            "address": getattr(run.hyperlink, 'address', 'Unknown')
-                        })
+        Returns:
+            Tuple of ((name, type, builtin) list, paragraph style names by ID,
+            (name, styled) for the default paragraph style)
+        """
+        style_list = []
+        styles_by_id = {}
+        default_style = ("Normal", False)
+        if root is None:
+            return style_list, {}, default_style
+        
+        for style in root.iterchildren(_W_STYLE):
+            name_element = style.find(_W_STYLE_NAME)
+            name = name_element.get(_W_VAL) if name_element is not None else None
+            if name is not None:
+                name = BabelFish.internal2ui(name)
             
-        except Exception as e:
-            logger.warning(f"Error analyzing structure: {str(e)}")
+            style_type = style.get(_W_TYPE)
+            style_list.append((
+                name,
+                str(WD_STYLE_TYPE.from_xml(style_type) if style_type else WD_STYLE_TYPE.PARAGRAPH),
+                style.get(_W_CUSTOM_STYLE) not in _ON_VALUES
+            ))
+            
+            styles_by_id.setdefault(style.get(_W_STYLE_ID), (style_type, name))
+            if style_type == "paragraph" and style.get(_W_DEFAULT) in _ON_VALUES:
+                default_style = (name, True)
         
-        return structure
+        paragraph_styles = {
+            style_id: name
+            for style_id, (style_type, name) in styles_by_id.items()
+            if style_id and style_type == "paragraph"
+        }
+        return style_list, paragraph_styles, default_style
     
-    def _analyze_styles(self, doc: Document) -> Dict[str, Any]:
-        """Analyze document styles"""
+    def _analyze_styles(self, styles: Iterable[Tuple[str, str, bool]]) -> Dict[str, Any]:
+        """Analyze document styles ("used_styles"/"style_counts" are filled in by _scan_paragraphs)
+        
+        Args:
+            styles: (name, type, builtin) tuples from _iter_styles or _read_xml_styles
+        """
         styles_info = {
             "available_styles": [],
-            "used_styles": set(),
+            "used_styles": [],
+            "style_counts": Counter(),
             "custom_styles": [],
             "heading_styles": []
         }
         
         try:
             # Get all available styles
-            for style in doc.styles:
+            for name, style_type, builtin in styles:
                 style_info = {
-                    "name": style.name,
-                    "type": str(style.type) if hasattr(style, 'type') else "Unknown",
-                    "builtin": style.builtin if hasattr(style, 'builtin') else False
+                    "name": name,
+                    "type": style_type,
+                    "builtin": builtin
                 }
                 styles_info["available_styles"].append(style_info)
                 
-                if style.name.startswith('Heading'):
-                    styles_info["heading_styles"].append(style.name)
+                if name.startswith('Heading'):
+                    styles_info["heading_styles"].append(name)
                 
-                if hasattr(style, 'builtin') and not style.builtin:
-                    styles_info["custom_styles"].append(style.name)
-            
-            # Track used styles
-            for para in doc.paragraphs:
-                if para.style:
-                    styles_info["used_styles"].add(para.style.name)
-            
-            styles_info["used_styles"] = list(styles_info["used_styles"])
+                if not builtin:
+                    styles_info["custom_styles"].append(name)
             
         except Exception as e:
             logger.warning(f"Error analyzing styles: {str(e)}")
@@ -365,6 +1069,30 @@ class DocxAccessibilityProcessor:
         
         return tables_info
     
+    def _analyze_xml_table(self, index: int, table) -> Dict[str, Any]:
+        """Streaming counterpart of _analyze_tables for a single <w:tbl> element"""
+        rows = list(table.iterchildren(_W_TR))
+        table_info = {
+            "index": index,
+            "rows": len(rows),
+            "cols": len(table.findall(_W_GRID_COL)) if rows else 0,
+            "has_header_row": False,
+            "cells": []
+        }
+        
+        # Check if first row looks like headers (a non-empty cell with bold text)
+        if rows:
+            for cell in rows[0].iterchildren(_W_TC):
+                paragraphs = list(cell.iterchildren(_W_P))
+                if not "\n".join(_xml_paragraph_text(p) for p in paragraphs).strip():
+                    continue
+                if any(_xml_on_off(run.find(_W_RUN_BOLD))
+                       for p in paragraphs for run in p.iterchildren(_W_R)):
+                    table_info["has_header_row"] = True
+                    break
+        
+        return table_info
+    
     def _get_color_info(self, color) -> Dict[str, Any]:
         """Extract color information from a run"""
         color_info = {
@@ -385,119 +1113,105 @@ class DocxAccessibilityProcessor:
         
         return color_info
     
+    def _get_xml_run_info(self, run, text: str) -> Dict[str, Any]:
+        """Streaming counterpart of the python-docx run info built in _iter_paragraphs"""
+        # Index the run properties once rather than searching per property
+        properties = {}
+        run_properties = run.find(_W_RUN_PROPERTIES)
+        if run_properties is not None:
+            for child in run_properties:
+                properties.setdefault(child.tag, child)
+        
+        fonts = properties.get(_W_FONTS)
+        
+        underline = properties.get(_W_UNDERLINE)
+        underline = underline.get(_W_VAL) if underline is not None else None
+        if underline is not None:
+            underline = WD_UNDERLINE.from_xml(underline)
+            if underline == WD_UNDERLINE.SINGLE:
+                underline = True
+            elif underline == WD_UNDERLINE.NONE:
+                underline = False
+        
+        color_info = {
+            "type": "auto",
+            "rgb": None,
+            "theme_color": None
+        }
+        color = properties.get(_W_COLOR)
+        if color is not None:
+            try:
+                val = color.get(_W_VAL)
+                theme_color = color.get(_W_THEME_COLOR)
+                if val and val != "auto":
+                    color_info["rgb"] = str(RGBColor.from_string(val))
+                    color_info["type"] = "rgb"
+                elif theme_color:
+                    color_info["theme_color"] = str(MSO_THEME_COLOR.from_xml(theme_color))
+                    color_info["type"] = "theme"
+            except Exception:
+                pass
+        
+        return {
+            "text": text,
+            "font_name": fonts.get(_W_ASCII) if fonts is not None else None,
+            "font_size": _xml_font_size(properties.get(_W_SIZE)),
+            "bold": _xml_on_off(properties.get(_W_BOLD)),
+            "italic": _xml_on_off(properties.get(_W_ITALIC)),
+            "underline": underline,
+            "color": color_info
+        }
+    
     def _check_document_structure(self, doc_info: Dict, structure: Dict):
         """Check document structure accessibility"""
         
         # Check for document title
         if not doc_info.get("title"):
-            self.issues.append({
-                "type": "structure",
-                "severity": "high",
-                "issue": "Missing document title",
-                "description": "Document should have a descriptive title in properties",
-                "recommendation": "Add a descriptive title in File > Info > Properties",
-                "wcag_criterion": "2.4.2 Page Titled"
-            })
+            self.issues.append(("missing_title", None))
         
         # Check for document language
         if not doc_info.get("language"):
-            self.issues.append({
-                "type": "structure",
-                "severity": "high", 
-                "issue": "Missing document language",
-                "description": "Document should specify its primary language",
-                "recommendation": "Set document language in Review > Language",
-                "wcag_criterion": "3.1.1 Language of Page"
-            })
+            self.issues.append(("missing_language", None))
         
         # Check heading structure
         if not structure.get("headings") and doc_info.get("paragraphs", 0) > 10:
-            self.issues.append({
-                "type": "structure",
-                "severity": "medium",
-                "issue": "Missing heading structure",
-                "description": "Long documents should use headings to organize content",
-                "recommendation": "Use Heading 1, Heading 2, etc. styles to structure content",
-                "wcag_criterion": "1.3.1 Info and Relationships"
-            })
+            self.issues.append(("missing_headings", None))
         
         # Check heading hierarchy
         if structure.get("headings") and not structure.get("has_proper_hierarchy"):
-            self.issues.append({
-                "type": "structure", 
-                "severity": "medium",
-                "issue": "Improper heading hierarchy",
-                "description": "Heading levels should not skip (e.g., H1 directly to H3)",
-                "recommendation": "Use sequential heading levels (H1, H2, H3, etc.)",
-                "wcag_criterion": "1.3.1 Info and Relationships"
-            })
+            self.issues.append(("improper_hierarchy", None))
     
     def _check_text_accessibility(self, text_content: Dict, styles: Dict):
         """Check text accessibility issues"""
         
         # Check for excessive all caps text
         if text_content.get("all_caps_count", 0) > 0:
-            self.issues.append({
-                "type": "text",
-                "severity": "medium",
-                "issue": f"{text_content['all_caps_count']} paragraphs in all caps",
-                "description": "All caps text is harder to read and may be interpreted as shouting",
-                "recommendation": "Use sentence case with bold or emphasis for importance",
-                "wcag_criterion": "1.4.8 Visual Presentation"
-            })
+            self.issues.append(("all_caps", {"count": text_content["all_caps_count"]}))
         
         # Check for small text
         if text_content.get("small_text_count", 0) > 0:
-            self.issues.append({
-                "type": "text",
-                "severity": "medium",
-                "issue": f"{text_content['small_text_count']} instances of small text (< 10pt)",
-                "description": "Very small text may be difficult for some users to read",
-                "recommendation": "Use minimum 10pt font size, preferably 12pt or larger",
-                "wcag_criterion": "1.4.12 Text Spacing"
-            })
+            self.issues.append(("small_text", {"count": text_content["small_text_count"]}))
         
         # Check reading level
         reading_level = text_content.get("reading_level")
         if reading_level:
             grade_level = reading_level.get("flesch_kincaid_grade", 0)
             if grade_level > 12:
-                self.issues.append({
-                    "type": "text",
-                    "severity": "low",
-                    "issue": f"Complex reading level: Grade {grade_level:.1f}",
-                    "description": "Content may be difficult for some users to understand",
-                    "recommendation": "Consider simplifying language where appropriate",
-                    "wcag_criterion": "3.1.5 Reading Level"
-                })
+                self.issues.append(("complex_reading_level", {"grade": grade_level}))
     
     def _check_image_accessibility(self, images: List[Dict]):
         """Check image accessibility"""
         
         for img in images:
             if not img.get("has_alt_text") and not img.get("is_decorative"):
-                self.issues.append({
-                    "type": "images",
-                    "severity": "high",
-                    "issue": f"Image '{img['filename']}' missing alternative text",
-                    "description": "Images need alternative text for screen readers",
-                    "recommendation": "Right-click image > Format Picture > Alt Text and add description",
-                    "wcag_criterion": "1.1.1 Non-text Content"
-                })
+                self.issues.append(("image_missing_alt_text", {"filename": img["filename"]}))
     
     def _check_table_accessibility(self, tables: List[Dict]):
         """Check table accessibility"""
         
         for table in tables:
             if not table.get("has_header_row") and table.get("rows", 0) > 1:
-                self.issues.append({
-                    "type": "tables",
-                    "severity": "medium",
-                    "issue": f"Table {table['index'] + 1} missing header row",
-                    "description": "Tables should have header rows to identify columns",
-                    "recommendation": "Select first row and use Table Design > Header Row",
-                    "wcag_criterion": "1.3.1 Info and Relationships"
-                })
+                self.issues.append(("table_missing_header", {"number": table["index"] + 1}))
     
     def _check_heading_structure(self, structure: Dict):
         """Check heading structure specifically"""
@@ -506,14 +1220,7 @@ class DocxAccessibilityProcessor:
         if headings:
             # Check if document starts with H1
             if headings[0]["level"] != 1:
-                self.issues.append({
-                    "type": "structure",
-                    "severity": "medium",
-                    "issue": "Document doesn't start with Heading 1",
-                    "description": "Documents should typically start with a Heading 1",
-                    "recommendation": "Use Heading 1 for the main document title",
-                    "wcag_criterion": "1.3.1 Info and Relationships"
-                })
+                self.issues.append(("missing_heading_1", None))
     
     def _check_style_accessibility(self, styles: Dict):
         """Check style usage for accessibility"""
@@ -522,18 +1229,28 @@ class DocxAccessibilityProcessor:
         
         # Check if only Normal style is used (poor structure)
         if len(used_styles) == 1 and "Normal" in used_styles:
-            self.issues.append({
-                "type": "structure",
-                "severity": "medium",
-                "issue": "Only Normal style used",
-                "description": "Using only Normal style makes content structure unclear",
-                "recommendation": "Use Heading styles and other built-in styles for structure",
-                "wcag_criterion": "1.3.1 Info and Relationships"
-            })
+            self.issues.append(("only_normal_style", None))
     
-    def _calculate_accessibility_score(self) -> int:
-        """Calculate overall accessibility score"""
-        if not self.issues:
+    def _count_severities(self) -> Counter:
+        """Count issues by severity, looking each issue type's severity up once"""
+        severity_counts = Counter()
+        for key, count in Counter(key for key, _ in self.issues).items():
+            severity_counts[_ISSUE_TEMPLATES[key]["severity"]] += count
+        return severity_counts
+    
+    def _materialize_issues(self) -> List[Dict[str, Any]]:
+        """Expand the recorded (template key, context) pairs into issue dictionaries"""
+        issues = []
+        for key, context in self.issues:
+            issue = dict(_ISSUE_TEMPLATES[key])
+            if context:
+                issue["issue"] = issue["issue"].format(**context)
+            issues.append(issue)
+        return issues
+    
+    def _calculate_accessibility_score(self, severity_counts: Counter) -> int:
+        """Calculate overall accessibility score from the issue counts by severity"""
+        if not severity_counts:
             return 100
         
         severity_weights = {
@@ -544,8 +1261,8 @@ class DocxAccessibilityProcessor:
         }
         
         total_deductions = sum(
-            severity_weights.get(issue["severity"], 5) 
-            for issue in self.issues
+            severity_weights.get(severity, 5) * count
+            for severity, count in severity_counts.items()
         )
         
         score = max(0, 100 - total_deductions)
@@ -578,28 +1295,38 @@ class DocxAccessibilityProcessor:
                     "description": f"Added document title: {title}"
                 })
             
-            # Fix 2: Convert all caps paragraphs to sentence case
+            # Fixes 2 and 3 share one pass over the paragraphs; their log
+            # entries are kept grouped by fix type
+            caps_fixes = []
+            size_fixes = []
             for para in doc.paragraphs:
-                if para.text.isupper() and len(para.text) > 5:
-                    # Convert to title case
-                    para.text = para.text.title()
-                    fixes_count += 1
-                    self.fixes_applied.append({
+                text = para.text
+                
+                # Fix 2: Convert all caps paragraphs to sentence case
+                if len(text) > 5 and text.isupper():
+                    # Convert to title case (replaces the runs with one unsized run)
+                    para.text = text.title()
+                    caps_fixes.append({
                         "type": "text",
                         "description": f"Converted all caps text to title case"
                     })
-            
-            # Fix 3: Increase very small font sizes
-            for para in doc.paragraphs:
+                    continue
+                
+                # Fix 3: Increase very small font sizes
                 for run in para.runs:
-                    if run.font.size and run.font.size.pt < 10:
-                        run.font.size = Pt(10)
-                        fixes_count += 1
-                        self.fixes_applied.append({
+                    font = run.font
+                    size = font.size
+                    if size and size < _MIN_FONT_SIZE:
+                        font.size = _MIN_FONT_SIZE
+                        size_fixes.append({
                             "type": "text",
                             "description": f"Increased font size to 10pt minimum"
                         })
             
+            fixes_count += len(caps_fixes) + len(size_fixes)
+            self.fixes_applied.extend(caps_fixes)
+            self.fixes_applied.extend(size_fixes)
+            
             # Save the modified document
             doc.save(str(output_path))
             
@@ -614,7 +1341,8 @@ class DocxAccessibilityProcessor:
             })
             return None
     
-    def _create_analysis_result(self, file_path: str, score: int, output_path: str = None, **kwargs) -> Dict[str, Any]:
+    def _create_analysis_result(self, file_path: str, score: int, severity_counts: Counter,
+                                output_path: str = None, quick: bool = False, **kwargs) -> Dict[str, Any]:
         """Create standardized analysis result"""
         return {
             "success": True,
@@ -623,15 +1351,16 @@ class DocxAccessibilityProcessor:
             "file_type": "docx",
             "accessibility_score": score,
             "total_issues": len(self.issues),
-            "critical_issues": len([i for i in self.issues if i["severity"] == "critical"]),
-            "high_issues": len([i for i in self.issues if i["severity"] == "high"]),
-            "medium_issues": len([i for i in self.issues if i["severity"] == "medium"]),
-            "low_issues": len([i for i in self.issues if i["severity"] == "low"]),
-            "issues": self.issues,
+            "critical_issues": severity_counts["critical"],
+            "high_issues": severity_counts["high"],
+            "medium_issues": severity_counts["medium"],
+            "low_issues": severity_counts["low"],
+            "issues": self._materialize_issues(),
             "fixes_applied": self.fixes_applied,
             "document_info": kwargs.get("doc_info", {}),
-            "recommendations": self._generate_recommendations(),
-            "wcag_compliance": self._assess_wcag_compliance()
+            "quick_analysis": quick,
+            "recommendations": self._generate_recommendations(severity_counts, quick),
+            "wcag_compliance": self._assess_wcag_compliance(severity_counts)
         }
     
     def _create_error_result(self, error_message: str) -> Dict[str, Any]:
@@ -646,17 +1375,18 @@ class DocxAccessibilityProcessor:
             "fixes_applied": []
         }
     
-    def _generate_recommendations(self) -> List[str]:
+    def _generate_recommendations(self, severity_counts: Counter, quick: bool = False) -> List[str]:
         """Generate prioritized recommendations"""
         recommendations = []
         
-        critical_issues = [i for i in self.issues if i["severity"] == "critical"]
-        high_issues = [i for i in self.issues if i["severity"] == "high"]
+        if quick:
+            recommendations.append("🔍 QUICK ANALYSIS: Images, tables and font sizes were not examined; "
+                                   "run a full analysis before remediating")
         
-        if critical_issues:
+        if severity_counts["critical"]:
             recommendations.append("❗ CRITICAL: Address document structure and accessibility features")
             
-        if high_issues:
+        if severity_counts["high"]:
             recommendations.append("🔥 HIGH PRIORITY: Add document metadata and alt text for images")
             
         recommendations.extend([
@@ -668,18 +1398,15 @@ class DocxAccessibilityProcessor:
         
         return recommendations
     
-    def _assess_wcag_compliance(self) -> Dict[str, str]:
+    def _assess_wcag_compliance(self, severity_counts: Counter) -> Dict[str, str]:
         """Assess WCAG 2.1 Level AA compliance"""
-        critical_issues = [i for i in self.issues if i["severity"] == "critical"]
-        high_issues = [i for i in self.issues if i["severity"] == "high"]
-        
-        if critical_issues:
+        if severity_counts["critical"]:
             return {
                 "level": "Non-compliant",
                 "status": "Major accessibility barriers present",
                 "next_steps": "Address critical issues before using in courses"
             }
-        elif high_issues:
+        elif severity_counts["high"]:
             return {
                 "level": "Partially compliant",
                 "status": "Some accessibility improvements needed", 
@@ -690,4 +1417,10 @@ class DocxAccessibilityProcessor:
                 "level": "Mostly compliant",
                 "status": "Meets most WCAG 2.1 AA requirements",
                 "next_steps": "Address remaining minor issues for full compliance"
-            }
\ No newline at end of file
+            }
+
+
+def _analyze_docx_job(job: Tuple[str, bool, bool]) -> Dict[str, Any]:
+    """analyze_many worker: analyze one (file_path, apply_fixes, quick) job with a fresh processor"""
+    file_path, apply_fixes, quick = job
+    return DocxAccessibilityProcessor().analyze_docx(file_path, apply_fixes, quick)
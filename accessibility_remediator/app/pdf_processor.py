@@ -8,44 +8,146 @@ and provides recommendations for improvement.
 import os
 import io
 import json
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import logging
 
-# PDF processing libraries
-try:
-    import PyPDF2
-    import fitz  # PyMuPDF
-    import pdfplumber
-except ImportError as e:
-    logging.warning(f"PDF processing libraries not available: {e}")
-    PyPDF2 = None
-    fitz = None
-    pdfplumber = None
+from .contrast_checker import ContrastChecker
+from .readability import calculate_reading_level
+from .workers import worker_context
 
-# OCR for scanned documents
-try:
-    import pytesseract
-    from PIL import Image
-except ImportError as e:
-    logging.warning(f"OCR libraries not available: {e}")
-    pytesseract = None
-    Image = None
+logger = logging.getLogger(__name__)
 
-# Text analysis
-try:
-    import textstat
-except ImportError:
-    textstat = None
+# PDF processing, OCR and text analysis libraries are heavy (PyMuPDF alone is
+# a large native library), so they are imported by _load_libraries when the
+# first processor is created rather than whenever this module is imported
+PyPDF2 = None
+fitz = None  # PyMuPDF
+pdfplumber = None
+pytesseract = None
+Image = None
+textstat = None
+_libraries_loaded = False
 
-from .contrast_checker import ContrastChecker
 
-logger = logging.getLogger(__name__)
+def _load_libraries():
+    """Import the optional PDF, OCR and text analysis libraries into module globals, once"""
+    global _libraries_loaded, PyPDF2, fitz, pdfplumber, pytesseract, Image, textstat
+    if _libraries_loaded:
+        return
+    _libraries_loaded = True
+    
+    # PDF processing libraries
+    try:
+        import PyPDF2
+        import fitz
+        import pdfplumber
+    except ImportError as e:
+        logging.warning(f"PDF processing libraries not available: {e}")
+        PyPDF2 = None
+        fitz = None
+        pdfplumber = None
+    
+    # OCR for scanned documents
+    try:
+        import pytesseract
+        from PIL import Image
+    except ImportError as e:
+        logging.warning(f"OCR libraries not available: {e}")
+        pytesseract = None
+        Image = None
+    
+    # Text analysis
+    try:
+        import textstat
+    except ImportError:
+        textstat = None
+
+# (fontname, size) of a pdfplumber char object
+_CHAR_FONT = itemgetter("fontname", "size")
+
+# OCR runs on grayscale, binarized images no larger than this on either side;
+# Tesseract's cost grows with pixel count and PDFs often embed 300-600 DPI scans
+_OCR_MAX_SIDE = 1600
+# LSTM engine only, one uniform block of text (skips page segmentation search)
+_OCR_CONFIG = "--oem 1 --psm 6"
+# Images below this many pixels are too small to hold readable text
+_OCR_MIN_PIXELS = 10_000
+# Text is high-contrast ink covering a minority of the area (either polarity);
+# measured on a small nearest-neighbour grayscale thumbnail of color images
+_TEXT_PROBE_SIZE = (128, 128)
+_TEXT_MIN_CONTRAST = 100
+_TEXT_INK_RANGE = (0.01, 0.4)
+
+
+def _otsu_threshold(histogram: List[int]) -> int:
+    """Gray level that best separates a 256-bin histogram into two classes (Otsu's method)"""
+    total = sum(histogram)
+    weighted_total = sum(level * count for level, count in enumerate(histogram))
+    background = weighted_background = 0
+    best_level, best_variance = 0, -1.0
+    
+    for level, count in enumerate(histogram):
+        background += count
+        if not background:
+            continue
+        foreground = total - background
+        if not foreground:
+            break
+        weighted_background += level * count
+        mean_background = weighted_background / background
+        mean_foreground = (weighted_total - weighted_background) / foreground
+        variance = background * foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_level, best_variance = level, variance
+    
+    return best_level
+
+
+def _is_likely_text(image: "Image.Image") -> bool:
+    """Cheap screen for whether a color image may contain text, before paying for OCR"""
+    probe = image.convert("L")
+    probe.thumbnail(_TEXT_PROBE_SIZE, Image.NEAREST)
+    histogram = probe.histogram()
+    
+    # Split at mid-gray: the minority class is the ink, the other the background
+    dark, light = sum(histogram[:128]), sum(histogram[128:])
+    if not dark or not light:
+        return False
+    mean_dark = sum(level * count for level, count in enumerate(histogram[:128])) / dark
+    mean_light = sum(level * count for level, count in enumerate(histogram[128:], 128)) / light
+    
+    ink = min(dark, light) / (dark + light)
+    return (mean_light - mean_dark >= _TEXT_MIN_CONTRAST
+            and _TEXT_INK_RANGE[0] <= ink <= _TEXT_INK_RANGE[1])
+
+
+def _prepare_for_ocr(image: "Image.Image") -> "Image.Image":
+    """Grayscale, downscale to _OCR_MAX_SIDE and binarize an image for Tesseract"""
+    image = image.convert("L")
+    image.thumbnail((_OCR_MAX_SIDE, _OCR_MAX_SIDE), Image.LANCZOS)
+    threshold = _otsu_threshold(image.histogram())
+    return image.point([0] * (threshold + 1) + [255] * (255 - threshold))
+
 
 class PDFAccessibilityProcessor:
     """Analyzes PDF documents for accessibility compliance"""
     
+    # Per-page work runs in worker processes for documents longer than this
+    # (worker startup and each worker's own parse of the PDF must pay back)
+    PARALLEL_PAGE_THRESHOLD = 24
+    MAX_PAGE_WORKERS = 4
+    
+    # _check_dependencies result, shared by all instances: the libraries are
+    # imported once per process, so the answer can't change after the first check
+    _dependencies_available: Optional[bool] = None
+    
     def __init__(self):
+        _load_libraries()
         self.contrast_checker = ContrastChecker()
         self.issues = []
         self.fixes_applied = []
@@ -54,6 +156,9 @@ class PDFAccessibilityProcessor:
         """
         Analyze a PDF document for accessibility issues
         
+        The PDF is opened once with PyMuPDF and once with pdfplumber, and the
+        open documents are shared by every extraction pass.
+        
         Args:
             file_path: Path to the PDF file
             apply_fixes: Whether to attempt automatic fixes
@@ -75,14 +180,17 @@ class PDFAccessibilityProcessor:
             if not os.path.exists(file_path):
                 return self._create_error_result(f"File not found: {file_path}")
             
-            # Open and analyze PDF
-            with open(file_path, 'rb') as file:
-                # Try multiple PDF libraries for best results
-                pdf_info = self._extract_pdf_info(file_path)
-                text_content = self._extract_text_content(file_path)
-                images = self._extract_images(file_path)
-                structure = self._analyze_structure(file_path)
-                
+            # Open and analyze PDF, using multiple PDF libraries for best results
+            doc = fitz.open(file_path)
+            try:
+                with pdfplumber.open(file_path) as pdf:
+                    pdf_info = self._extract_pdf_info(file_path, doc)
+                    text_content = self._extract_text_content(pdf)
+                    images, tables, links = self._scan_pages(file_path, doc)
+                    structure = self._analyze_structure(doc, tables, links)
+            finally:
+                doc.close()
+            
             # Perform accessibility checks
             self._check_document_structure(pdf_info, structure)
             self._check_text_accessibility(text_content)
@@ -91,7 +199,8 @@ class PDFAccessibilityProcessor:
             self._check_color_accessibility(file_path)
             
             # Calculate accessibility score
-            score = self._calculate_accessibility_score()
+            severity_counts = Counter(issue["severity"] for issue in self.issues)
+            score = self._calculate_accessibility_score(severity_counts)
             
             # Apply fixes if requested
             if apply_fixes:
@@ -100,6 +209,7 @@ class PDFAccessibilityProcessor:
             return self._create_analysis_result(
                 file_path=file_path,
                 score=score,
+                severity_counts=severity_counts,
                 pdf_info=pdf_info,
                 text_content=text_content,
                 images=images,
@@ -111,22 +221,29 @@ class PDFAccessibilityProcessor:
             return self._create_error_result(f"Analysis failed: {str(e)}")
     
     def _check_dependencies(self) -> bool:
-        """Check if required libraries are available"""
-        missing = []
-        if not PyPDF2:
-            missing.append("PyPDF2")
-        if not fitz:
-            missing.append("PyMuPDF")
-        if not pdfplumber:
-            missing.append("pdfplumber")
+        """Check if required libraries are available (logged and cached on the first call)"""
+        cls = type(self)
+        if cls._dependencies_available is None:
+            missing = []
+            if not PyPDF2:
+                missing.append("PyPDF2")
+            if not fitz:
+                missing.append("PyMuPDF")
+            if not pdfplumber:
+                missing.append("pdfplumber")
             
-        if missing:
-            logger.error(f"Missing PDF processing libraries: {', '.join(missing)}")
-            return False
-        return True
+            if missing:
+                logger.error(f"Missing PDF processing libraries: {', '.join(missing)}")
+            cls._dependencies_available = not missing
+        return cls._dependencies_available
     
-    def _extract_pdf_info(self, file_path: str) -> Dict[str, Any]:
-        """Extract basic PDF metadata and properties"""
+    def _extract_pdf_info(self, file_path: str, doc: "fitz.Document") -> Dict[str, Any]:
+        """Extract basic PDF metadata and properties
+        
+        Args:
+            file_path: Path to the PDF file (read by PyPDF2)
+            doc: The open PyMuPDF document
+        """
         info = {
             "title": None,
             "author": None,
@@ -158,15 +275,14 @@ class PDFAccessibilityProcessor:
                 info["security"]["encrypted"] = pdf_reader.is_encrypted
             
             # Using PyMuPDF for additional metadata
-            doc = fitz.open(file_path)
             metadata = doc.metadata
             
             # Check if PDF is tagged (structured)
-            info["is_tagged"] = "XML" in str(doc.get_xml_metadata()) if doc.get_xml_metadata() else False
+            xml_metadata = doc.get_xml_metadata()
+            info["is_tagged"] = "XML" in str(xml_metadata) if xml_metadata else False
             
             # Check for form fields
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
+            for page in doc:
                 if page.get_form_fields():
                     info["has_forms"] = True
                     break
@@ -175,15 +291,13 @@ class PDFAccessibilityProcessor:
             if metadata.get("language"):
                 info["language"] = metadata["language"]
             
-            doc.close()
-            
         except Exception as e:
             logger.warning(f"Error extracting PDF info: {str(e)}")
         
         return info
     
-    def _extract_text_content(self, file_path: str) -> Dict[str, Any]:
-        """Extract and analyze text content from PDF"""
+    def _extract_text_content(self, pdf: "pdfplumber.PDF") -> Dict[str, Any]:
+        """Extract and analyze text content from an open pdfplumber PDF"""
         content = {
             "pages": [],
             "total_chars": 0,
@@ -192,49 +306,46 @@ class PDFAccessibilityProcessor:
             "reading_level": None
         }
         
+        # Page texts are only needed for the reading level, so they are kept
+        # here rather than in content["pages"], and dropped on return
+        page_texts = []
+        
         try:
             # Use pdfplumber for better text extraction
-            with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    page_text = page.extract_text() or ""
-                    
-                    # Get character-level details
-                    chars = page.chars
-                    
-                    page_info = {
-                        "page_number": page_num + 1,
-                        "text": page_text,
-                        "char_count": len(page_text),
-                        "fonts": []
-                    }
-                    
-                    # Analyze font usage
-                    if chars:
-                        fonts_used = {}
-                        for char in chars:
-                            font_key = f"{char.get('fontname', 'Unknown')}_{char.get('size', 0)}"
-                            if font_key not in fonts_used:
-                                fonts_used[font_key] = {
-                                    "fontname": char.get('fontname', 'Unknown'),
-                                    "size": char.get('size', 0),
-                                    "count": 0
-                                }
-                            fonts_used[font_key]["count"] += 1
-                        
-                        page_info["fonts"] = list(fonts_used.values())
-                        content["font_info"].extend(page_info["fonts"])
+            for page_num, page in enumerate(pdf.pages):
+                page_text = page.extract_text() or ""
+                page_texts.append(page_text)
+                
+                # Get character-level details (parsed once per page and
+                # shared with extract_text)
+                chars = page.chars
+                
+                page_info = {
+                    "page_number": page_num + 1,
+                    "char_count": len(page_text),
+                    "fonts": []
+                }
+                
+                # Analyze font usage (Counter keeps first-seen order)
+                if chars:
+                    fonts_used = Counter(map(_CHAR_FONT, chars))
                     
-                    content["pages"].append(page_info)
-                    content["total_chars"] += len(page_text)
-            
+                    page_info["fonts"] = [
+                        {"fontname": fontname, "size": size, "count": count}
+                        for (fontname, size), count in fonts_used.items()
+                    ]
+                    content["font_info"].extend(page_info["fonts"])
+                
+                content["pages"].append(page_info)
+                content["total_chars"] += len(page_text)
+                
+                # Drop the page's parsed layout objects; pdf.pages would
+                # otherwise keep every character of the document alive
+                page.flush_cache()
+        
             # Calculate reading level if textstat is available
             if textstat and content["total_chars"] > 100:
-                full_text = " ".join([page["text"] for page in content["pages"]])
-                content["reading_level"] = {
-                    "flesch_reading_ease": textstat.flesch_reading_ease(full_text),
-                    "flesch_kincaid_grade": textstat.flesch_kincaid_grade(full_text),
-                    "automated_readability_index": textstat.automated_readability_index(full_text)
-                }
+                content["reading_level"] = calculate_reading_level(" ".join(page_texts))
             
         except Exception as e:
             logger.warning(f"Error extracting text content: {str(e)}")
@@ -242,73 +353,68 @@ class PDFAccessibilityProcessor:
         
         return content
     
-    def _extract_images(self, file_path: str) -> List[Dict[str, Any]]:
-        """Extract and analyze images from PDF"""
-        images = []
+    def _scan_pages(self, file_path: str, doc: "fitz.Document") -> Tuple[List[Dict[str, Any]],
+                                                                      List[Dict[str, Any]],
+                                                                      List[Dict[str, Any]]]:
+        """
+        Run the per-page PyMuPDF work (images with OCR, tables, links)
         
-        try:
-            doc = fitz.open(file_path)
-            
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                image_list = page.get_images()
-                
-                for img_index, img in enumerate(image_list):
-                    try:
-                        # Extract image
-                        xref = img[0]
-                        base_image = doc.extract_image(xref)
-                        image_bytes = base_image["image"]
-                        
-                        # Basic image info
-                        image_info = {
-                            "page": page_num + 1,
-                            "index": img_index,
-                            "width": base_image["width"],
-                            "height": base_image["height"],
-                            "colorspace": base_image["colorspace"],
-                            "has_alt_text": False,  # PDFs don't typically have alt text
-                            "is_decorative": False,
-                            "size_bytes": len(image_bytes)
-                        }
-                        
-                        # Try to determine if image contains text (needs OCR)
-                        if pytesseract and Image:
-                            try:
-                                pil_image = Image.open(io.BytesIO(image_bytes))
-                                extracted_text = pytesseract.image_to_string(pil_image).strip()
-                                image_info["contains_text"] = len(extracted_text) > 10
-                                image_info["extracted_text"] = extracted_text[:200]  # First 200 chars
-                            except Exception:
-                                image_info["contains_text"] = False
-                        
-                        images.append(image_info)
-                        
-                    except Exception as e:
-                        logger.warning(f"Error processing image {img_index} on page {page_num + 1}: {str(e)}")
-            
-            doc.close()
-            
-        except Exception as e:
-            logger.warning(f"Error extracting images: {str(e)}")
+        Pages are independent and OCR and table detection are CPU-bound, so
+        documents longer than PARALLEL_PAGE_THRESHOLD pages are split into
+        contiguous page ranges scanned in worker processes, each opening its
+        own copy of the PDF (PyMuPDF documents can't be shared across
+        processes). Workers come from workers.worker_context, never a fork of
+        the caller. Shorter documents are scanned here with the open doc.
         
-        return images
+        Args:
+            file_path: Path to the PDF file (opened by the workers)
+            doc: The open PyMuPDF document
+            
+        Returns:
+            Tuple of (images, tables, links) in page order
+        """
+        page_count = doc.page_count
+        workers = min(os.cpu_count() or 1, self.MAX_PAGE_WORKERS, page_count)
+        
+        if page_count > self.PARALLEL_PAGE_THRESHOLD and workers > 1:
+            bounds = [page_count * i // workers for i in range(workers + 1)]
+            jobs = [(file_path, start, stop) for start, stop in zip(bounds, bounds[1:])]
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=worker_context()) as executor:
+                    pages = [page for block in executor.map(_scan_page_range, jobs) for page in block]
+            except Exception as e:
+                logger.warning(f"Parallel page scan failed, scanning pages in-process: {str(e)}")
+                pages = [_scan_page(doc, page_num) for page_num in range(page_count)]
+        else:
+            pages = [_scan_page(doc, page_num) for page_num in range(page_count)]
+        
+        images, tables, links = [], [], []
+        for page in pages:
+            images.extend(page["images"])
+            tables.extend(page["tables"])
+            links.extend(page["links"])
+        return images, tables, links
     
-    def _analyze_structure(self, file_path: str) -> Dict[str, Any]:
-        """Analyze document structure and navigation"""
+    def _analyze_structure(self, doc: "fitz.Document", tables: List[Dict[str, Any]],
+                           links: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Analyze document structure and navigation of an open PyMuPDF document
+        
+        Args:
+            doc: The open PyMuPDF document
+            tables: Table info from _scan_pages
+            links: Link info from _scan_pages
+        """
         structure = {
             "has_headings": False,
             "heading_levels": [],
             "has_toc": False,
             "has_bookmarks": False,
             "reading_order": "unknown",
-            "tables": [],
-            "links": []
+            "tables": tables,
+            "links": links
         }
         
         try:
-            doc = fitz.open(file_path)
-            
             # Check for table of contents
             toc = doc.get_toc()
             structure["has_toc"] = len(toc) > 0
@@ -318,31 +424,6 @@ class PDFAccessibilityProcessor:
                 structure["heading_levels"] = [item[0] for item in toc]  # Extract levels
                 structure["has_headings"] = True
             
-            # Analyze each page for structure
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                
-                # Look for tables
-                tables = page.find_tables()
-                for table in tables:
-                    structure["tables"].append({
-                        "page": page_num + 1,
-                        "rows": table.row_count if hasattr(table, 'row_count') else 0,
-                        "cols": table.col_count if hasattr(table, 'col_count') else 0
-                    })
-                
-                # Look for links
-                links = page.get_links()
-                for link in links:
-                    structure["links"].append({
-                        "page": page_num + 1,
-                        "type": link.get("kind", "unknown"),
-                        "uri": link.get("uri", ""),
-                        "text": "Unknown"  # Would need more analysis to get link text
-                    })
-            
-            doc.close()
-            
         except Exception as e:
             logger.warning(f"Error analyzing structure: {str(e)}")
         
@@ -512,9 +593,9 @@ class PDFAccessibilityProcessor:
             "wcag_criterion": "1.4.3 Contrast (Minimum)"
         })
     
-    def _calculate_accessibility_score(self) -> int:
-        """Calculate overall accessibility score"""
-        if not self.issues:
+    def _calculate_accessibility_score(self, severity_counts: Counter) -> int:
+        """Calculate overall accessibility score from the issue counts by severity"""
+        if not severity_counts:
             return 100
         
         # Weight issues by severity
@@ -526,8 +607,8 @@ class PDFAccessibilityProcessor:
         }
         
         total_deductions = sum(
-            severity_weights.get(issue["severity"], 5) 
-            for issue in self.issues
+            severity_weights.get(severity, 5) * count
+            for severity, count in severity_counts.items()
         )
         
         # Cap minimum score at 0
@@ -555,7 +636,8 @@ class PDFAccessibilityProcessor:
             "recommendation": "Use Adobe Acrobat Pro or similar tools for PDF accessibility fixes"
         }]
     
-    def _create_analysis_result(self, file_path: str, score: int, **kwargs) -> Dict[str, Any]:
+    def _create_analysis_result(self, file_path: str, score: int, severity_counts: Counter,
+                                **kwargs) -> Dict[str, Any]:
         """Create standardized analysis result"""
         return {
             "success": True,
@@ -563,15 +645,15 @@ class PDFAccessibilityProcessor:
             "file_type": "pdf",
             "accessibility_score": score,
             "total_issues": len(self.issues),
-            "critical_issues": len([i for i in self.issues if i["severity"] == "critical"]),
-            "high_issues": len([i for i in self.issues if i["severity"] == "high"]),
-            "medium_issues": len([i for i in self.issues if i["severity"] == "medium"]),
-            "low_issues": len([i for i in self.issues if i["severity"] == "low"]),
+            "critical_issues": severity_counts["critical"],
+            "high_issues": severity_counts["high"],
+            "medium_issues": severity_counts["medium"],
+            "low_issues": severity_counts["low"],
             "issues": self.issues,
             "fixes_applied": self.fixes_applied,
             "document_info": kwargs.get("pdf_info", {}),
-            "recommendations": self._generate_recommendations(),
-            "wcag_compliance": self._assess_wcag_compliance()
+            "recommendations": self._generate_recommendations(severity_counts),
+            "wcag_compliance": self._assess_wcag_compliance(severity_counts)
         }
     
     def _create_error_result(self, error_message: str) -> Dict[str, Any]:
@@ -586,17 +668,14 @@ class PDFAccessibilityProcessor:
             "fixes_applied": []
         }
     
-    def _generate_recommendations(self) -> List[str]:
+    def _generate_recommendations(self, severity_counts: Counter) -> List[str]:
         """Generate prioritized recommendations"""
         recommendations = []
         
-        critical_issues = [i for i in self.issues if i["severity"] == "critical"]
-        high_issues = [i for i in self.issues if i["severity"] == "high"]
-        
-        if critical_issues:
+        if severity_counts["critical"]:
             recommendations.append("❗ CRITICAL: Address document tagging and text extraction issues first")
             
-        if high_issues:
+        if severity_counts["high"]:
             recommendations.append("🔥 HIGH PRIORITY: Add document metadata and image descriptions")
             
         recommendations.extend([
@@ -607,18 +686,15 @@ class PDFAccessibilityProcessor:
         
         return recommendations
     
-    def _assess_wcag_compliance(self) -> Dict[str, str]:
+    def _assess_wcag_compliance(self, severity_counts: Counter) -> Dict[str, str]:
         """Assess WCAG 2.1 Level AA compliance"""
-        critical_issues = [i for i in self.issues if i["severity"] == "critical"]
-        high_issues = [i for i in self.issues if i["severity"] == "high"]
-        
-        if critical_issues:
+        if severity_counts["critical"]:
             return {
                 "level": "Non-compliant",
                 "status": "Major accessibility barriers present",
                 "next_steps": "Address critical issues before using in courses"
             }
-        elif high_issues:
+        elif severity_counts["high"]:
             return {
                 "level": "Partially compliant", 
                 "status": "Some accessibility improvements needed",
@@ -629,4 +705,159 @@ class PDFAccessibilityProcessor:
                 "level": "Mostly compliant",
                 "status": "Meets most WCAG 2.1 AA requirements",
                 "next_steps": "Address remaining minor issues for full compliance"
-            }
\ No newline at end of file
+            }
+
+
+def _scan_page(doc: "fitz.Document", page_num: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Collect the images, tables and links of one page of an open PyMuPDF document"""
+    page_info = {"images": [], "tables": [], "links": []}
+    
+    try:
+        page = doc[page_num]
+    except Exception as e:
+        logger.warning(f"Error loading page {page_num + 1}: {str(e)}")
+        return page_info
+    
+    try:
+        page_info["images"] = _extract_page_images(doc, page, page_num)
+    except Exception as e:
+        logger.warning(f"Error extracting images on page {page_num + 1}: {str(e)}")
+    
+    try:
+        # Look for tables
+        for table in page.find_tables():
+            page_info["tables"].append({
+                "page": page_num + 1,
+                "rows": getattr(table, 'row_count', 0),
+                "cols": getattr(table, 'col_count', 0)
+            })
+        
+        # Look for links
+        for link in page.get_links():
+            page_info["links"].append({
+                "page": page_num + 1,
+                "type": link.get("kind", "unknown"),
+                "uri": link.get("uri", ""),
+                "text": "Unknown"  # Would need more analysis to get link text
+            })
+    except Exception as e:
+        logger.warning(f"Error analyzing structure on page {page_num + 1}: {str(e)}")
+    
+    return page_info
+
+
+def _ocr_candidate(doc: "fitz.Document", xref: int, image_info: Dict[str, Any]) -> Optional["Image.Image"]:
+    """
+    Extract and decode a PDF image and prepare it for OCR
+    
+    Returns None for images too small to hold text, or color images that
+    look like photographs (see _is_likely_text), which are not worth OCR.
+    The small-image test uses image_info alone, before the image is extracted.
+    """
+    if image_info["width"] * image_info["height"] < _OCR_MIN_PIXELS:
+        return None
+    
+    pil_image = Image.open(io.BytesIO(doc.extract_image(xref)["image"]))
+    if image_info["colorspace"] >= 3 and not _is_likely_text(pil_image):
+        return None
+    
+    return _prepare_for_ocr(pil_image)
+
+
+def _ocr_images(images: List["Image.Image"]) -> List[str]:
+    """
+    OCR prepared images with a single Tesseract process
+    
+    Several images are stacked into one multi-page TIFF: Tesseract reads
+    every page in one run and ends each page's text with a form feed.
+    """
+    if len(images) == 1:
+        return [pytesseract.image_to_string(images[0], config=_OCR_CONFIG).strip()]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        stack_path = os.path.join(temp_dir, "images.tif")
+        images[0].save(stack_path, save_all=True, append_images=images[1:])
+        pages = pytesseract.image_to_string(stack_path, config=_OCR_CONFIG).split("\f")
+    
+    if len(pages) < len(images):
+        raise RuntimeError(f"Tesseract returned {len(pages)} pages for {len(images)} images")
+    return [text.strip() for text in pages[:len(images)]]
+
+
+def _extract_page_images(doc: "fitz.Document", page: "fitz.Page", page_num: int) -> List[Dict[str, Any]]:
+    """
+    Analyze the images on one page, with one OCR run for all of them
+    
+    Image properties come from the PDF's image dictionaries (get_images,
+    get_image_info), so only images that go on to OCR are extracted.
+    """
+    images = []
+    page_images = page.get_images()
+    if not page_images:
+        return images
+    
+    # (image_info, prepared image) for the images worth checking for text
+    ocr_targets = []
+    # Component count and stored size of each image drawn on the page
+    placed = {info["xref"]: info for info in page.get_image_info(xrefs=True)}
+    
+    for img_index, img in enumerate(page_images):
+        try:
+            xref, _, width, height = img[:4]
+            if xref in placed:
+                colorspace, size_bytes = placed[xref]["colorspace"], placed[xref]["size"]
+            else:
+                # In the page's resources but not drawn: read the image itself
+                base_image = doc.extract_image(xref)
+                colorspace, size_bytes = base_image["colorspace"], len(base_image["image"])
+            
+            # Basic image info
+            image_info = {
+                "page": page_num + 1,
+                "index": img_index,
+                "width": width,
+                "height": height,
+                "colorspace": colorspace,
+                "has_alt_text": False,  # PDFs don't typically have alt text
+                "is_decorative": False,
+                "size_bytes": size_bytes
+            }
+            
+            # Try to determine if image contains text (needs OCR, run below)
+            if pytesseract and Image:
+                image_info["contains_text"] = False
+                try:
+                    candidate = _ocr_candidate(doc, xref, image_info)
+                except Exception:
+                    candidate = None
+                if candidate is not None:
+                    ocr_targets.append((image_info, candidate))
+            
+            images.append(image_info)
+            
+        except Exception as e:
+            logger.warning(f"Error processing image {img_index} on page {page_num + 1}: {str(e)}")
+    
+    if ocr_targets:
+        try:
+            texts = _ocr_images([candidate for _, candidate in ocr_targets])
+        except Exception as e:
+            logger.warning(f"Error running OCR on page {page_num + 1} images: {str(e)}")
+            texts = []
+        
+        for (image_info, _), extracted_text in zip(ocr_targets, texts):
+            image_info["contains_text"] = len(extracted_text) > 10
+            image_info["extracted_text"] = extracted_text[:200]  # First 200 chars
+    
+    return images
+
+
+def _scan_page_range(job: Tuple[str, int, int]) -> List[Dict[str, List[Dict[str, Any]]]]:
+    """_scan_pages worker: open the PDF and scan pages [start, stop) of a (file_path, start, stop) job"""
+    file_path, start, stop = job
+    _load_libraries()
+    doc = fitz.open(file_path)
+    try:
+        return [_scan_page(doc, page_num) for page_num in range(start, stop)]
+    finally:
+        doc.close()
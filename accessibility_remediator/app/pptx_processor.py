@@ -55,19 +55,19 @@ class PowerPointProcessor:
         
         try:
             presentation = Presentation(str(pptx_path))
-            slide_analyses = []
             
-            for i, slide in enumerate(presentation.slides, 1):
-                self.logger.debug(f"Analyzing slide {i}/{len(presentation.slides)}")
-                
-                # Extract slide data
-                slide_data = self._extract_slide_data(slide, i)
-                
-                # Get AI analysis
-                analysis = self.ai_assistant.analyze_slide(slide_data)
+            # Extract slide data
+            slides_data = [
+                self._extract_slide_data(slide, i)
+                for i, slide in enumerate(presentation.slides, 1)
+            ]
+            
+            # Get AI analysis for all slides concurrently
+            self.logger.debug(f"Analyzing {len(slides_data)} slides")
+            slide_analyses = self.ai_assistant.analyze_slides_sync(slides_data)
+            
+            for slide_data, analysis in zip(slides_data, slide_analyses):
                 analysis.title = slide_data.get('title')
-                
-                slide_analyses.append(analysis)
             
             # Calculate overall metrics
             total_issues = sum(
@@ -0,0 +1,76 @@
+"""
+Readability Module
+
+Reading level scores for the document processors, matching the pinned
+textstat release. textstat's flesch_reading_ease, flesch_kincaid_grade and
+automated_readability_index each re-tokenize the text and recount its
+syllables, so reading_level takes the counts once and applies textstat's
+(English) formulas directly, including its rounding of the intermediate
+averages.
+
+textstat is imported when a score is first computed, so importing this
+module doesn't load it; callers check that textstat is available.
+"""
+
+import math
+from functools import lru_cache
+from typing import Dict
+
+
+@lru_cache(maxsize=65536)
+def _word_syllables(word: str) -> int:
+    """
+    textstat syllable count for one lowercased, punctuation-stripped word
+    
+    Document vocabulary is heavily repeated, so most words after the first
+    few thousand are cache hits rather than fresh hyphenation lookups.
+    """
+    import textstat
+    return textstat.syllable_count(word)
+
+
+def _legacy_round(number: float, points: int) -> float:
+    """Round half away from zero, as textstat rounds its intermediate averages and scores"""
+    scale = 10 ** points
+    return math.floor(number * scale + math.copysign(0.5, number)) / scale
+
+
+def calculate_reading_level(text: str) -> Dict[str, float]:
+    """
+    Compute readability scores from a single set of textstat base counts
+    
+    Words are tokenized once the way textstat's syllable_count does, and
+    syllables are summed per word through the cached _word_syllables.
+    
+    Args:
+        text: Full document text
+    
+    Returns:
+        Dictionary of flesch_reading_ease, flesch_kincaid_grade and
+        automated_readability_index, equal to textstat's own results
+    """
+    import textstat
+    
+    word_list = textstat.remove_punctuation(text.lower()).split()
+    words = len(word_list)
+    sentences = textstat.sentence_count(text)
+    syllables = sum(map(_word_syllables, word_list))
+    chars = textstat.char_count(text, ignore_spaces=True)
+    
+    if not words:
+        return {
+            "flesch_reading_ease": _legacy_round(206.835, 2),
+            "flesch_kincaid_grade": _legacy_round(-15.59, 1),
+            "automated_readability_index": 0.0
+        }
+    
+    sentence_length = _legacy_round(words / sentences, 1)
+    syllables_per_word = _legacy_round(syllables / words, 1)
+    
+    return {
+        "flesch_reading_ease": _legacy_round(206.835 - 1.015 * sentence_length - 84.6 * syllables_per_word, 2),
+        "flesch_kincaid_grade": _legacy_round(0.39 * sentence_length + 11.8 * syllables_per_word - 15.59, 1),
+        "automated_readability_index": _legacy_round(
+            4.71 * _legacy_round(chars / words, 2) + 0.5 * _legacy_round(words / sentences, 2) - 21.43, 1
+        )
+    }
@@ -0,0 +1,41 @@
+"""
+Worker Processes Module
+
+The multiprocessing context shared by the document processors' worker pools
+(PDF page scans and batch Word analysis), so both start their workers the
+same way.
+"""
+
+import multiprocessing
+from functools import lru_cache
+
+# Processor modules the forkserver imports up front; their optional
+# libraries come with them, or are skipped if they aren't installed
+_PRELOAD_MODULES = [
+    f"{__package__}.pdf_processor",
+    f"{__package__}.docx_processor",
+    "fitz",
+    "pdfplumber",
+    "PyPDF2",
+    "pytesseract",
+    "PIL.Image",
+]
+
+
+@lru_cache(maxsize=None)
+def worker_context() -> multiprocessing.context.BaseContext:
+    """
+    Multiprocessing context for the processors' worker pools
+    
+    Forking the caller (the Linux default) would copy a threaded web server
+    into every worker, so workers are started by a forkserver (spawn where
+    there is none). There is one forkserver per process, so it preloads the
+    modules for every pool once, and later pools' workers start without
+    importing them again.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(_PRELOAD_MODULES)
+    return context
@@ -56,7 +56,8 @@ def process_document(
     ollama_host: str,
     model_name: str,
     auto_fix: bool,
-    verbose: bool
+    verbose: bool,
+    cache_file: Optional[str] = None
 ) -> None:
     """Process a single document file (PowerPoint, PDF, Word, or HTML)."""
     logger = logging.getLogger(__name__)
@@ -68,7 +69,8 @@ def process_document(
     ai_assistant = None
     if input_file.suffix.lower() in {'.pptx', '.html', '.htm'}:
         try:
-            ai_assistant = AIAssistant(host=ollama_host, model=model_name)
+            ai_assistant = AIAssistant(host=ollama_host, model=model_name, cache_path=cache_file,
+                                       validate=True)
             logger.info(f"Connected to Ollama at {ollama_host} using model '{model_name}'")
         except Exception as e:
             logger.error(f"Failed to connect to Ollama: {e}")
@@ -213,6 +215,13 @@ Examples:
         help="Ollama model name to use (default: auto-select best available from llama3.1:8b, qwen2.5:14b, llama3:8b, phi3:3.8b, llama2)"
     )
     
+    parser.add_argument(
+        "--cache-file",
+        type=str,
+        default=None,
+        help="SQLite file for caching AI responses across runs (default: in-memory only)"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -240,7 +249,8 @@ Examples:
             ollama_host=args.ollama_host,
             model_name=args.model,
             auto_fix=args.auto_fix,
-            verbose=args.verbose
+            verbose=args.verbose,
+            cache_file=args.cache_file
         )
         
     except (FileNotFoundError, ValueError) as e:
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test WCAG 2.1 contrast ratio calculation against reference values.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "accessibility_remediator"))
+
+from app.contrast_checker import ContrastChecker, _parse_color
+
+
+def test_gray_on_white_matches_wcag_reference():
+    """#777777 on white is the WCAG reference 4.48:1, just short of AA for normal text"""
+    checker = ContrastChecker()
+    
+    ratio = checker._calculate_contrast_ratio(_parse_color('#777777'), _parse_color('#ffffff'))
+    
+    assert abs(ratio - 4.478) < 0.001
+    assert round(ratio, 2) == 4.48
+    assert not checker.check_contrast('#777777', '#ffffff').meets_aa_normal
+
+
+def test_black_on_white_is_maximum_contrast():
+    """Black on white is the 21:1 maximum, in either order"""
+    checker = ContrastChecker()
+    black, white = _parse_color('#000'), _parse_color('#fff')
+    
+    assert checker._calculate_contrast_ratio(black, white) == 21.0
+    assert checker._calculate_contrast_ratio(white, black) == 21.0
+
+
+def test_every_failed_color_parse_is_logged(caplog):
+    """Parse results are cached, but malformed and unknown colors are still logged on each call"""
+    with caplog.at_level(logging.WARNING):
+        for _ in range(2):
+            assert _parse_color('#ggg') is None
+            assert _parse_color('rgb(300,0,0)') == 0x000000
+    
+    assert sum('#ggg is not a valid hex color' in message for message in caplog.messages) == 2
+    assert sum('Could not parse color: rgb(300,0,0)' in message for message in caplog.messages) == 2
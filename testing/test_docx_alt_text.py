@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test that the streaming and python-docx DOCX readers agree on image alt text.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "accessibility_remediator"))
+
+docx = pytest.importorskip("docx")
+Image = pytest.importorskip("PIL.Image")
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from app.docx_processor import DocxAccessibilityProcessor
+
+
+def _build_cover_page_docx(path: Path):
+    """Save a document whose only picture sits in a body-level content control, like Word's cover pages"""
+    image = io.BytesIO()
+    Image.new("RGB", (8, 8), "white").save(image, format="PNG")
+    image.seek(0)
+    
+    document = docx.Document()
+    picture_paragraph = document.add_paragraph()
+    picture_paragraph.add_run().add_picture(image)
+    document.add_paragraph("Annual report")
+    
+    doc_pr = picture_paragraph._p.find(".//" + qn("wp:docPr"))
+    doc_pr.set("descr", "University logo")
+    
+    sdt = OxmlElement("w:sdt")
+    sdt_content = OxmlElement("w:sdtContent")
+    picture_paragraph._p.addprevious(sdt)
+    sdt.append(sdt_content)
+    sdt_content.append(picture_paragraph._p)
+    
+    document.save(str(path))
+
+
+def test_stream_reader_reads_alt_text_inside_content_controls(tmp_path):
+    """Images in a body-level w:sdt keep their alt text in both readers"""
+    path = tmp_path / "cover_page.docx"
+    _build_cover_page_docx(path)
+    processor = DocxAccessibilityProcessor()
+    
+    streamed = processor._read_docx_stream(str(path))["images"]
+    loaded = processor._read_docx(docx.Document(str(path)))["images"]
+    
+    assert len(streamed) == 1
+    assert streamed[0]["has_alt_text"]
+    assert streamed[0]["alt_text"] == "University logo"
+    assert streamed == loaded